@@ -78,8 +78,12 @@ JSON Output Format:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
 import json
 import os
+import shutil
 import time
 import argparse
 from pathlib import Path
@@ -89,6 +93,9 @@ from typing import List, Dict, Optional, Tuple
 import logging
 from bs4 import BeautifulSoup
 import random  # Added for random sampling
+from collections import deque
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 # Selenium imports for browser automation
 try:
@@ -105,6 +112,46 @@ except ImportError:
     print("Warning: Selenium not installed. Install with: pip install selenium")
     print("Browser authentication will not be available.")
 
+# Block size for streaming video downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Optional faster JSON parser (falls back to the standard library)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_loads(data):
+    """Parse JSON from a str or bytes object, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj) -> str:
+    """Serialize an object to an indented, non-ASCII-escaped JSON string, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+def _write_text_atomic(path: Path, text: str):
+    """Write text to a temporary file next to path, then swap it into place with os.replace."""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+# Brotli is only advertised when a decoder is installed, since urllib3 can't decompress it otherwise
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
 # Import ignore list functionality
 try:
     from add_to_ignore_list import IgnoreListManager
@@ -112,11 +159,187 @@ try:
 except ImportError:
     IGNORE_LIST_AVAILABLE = False
 
+# Precompiled patterns used when extracting Adobe Stock video IDs from HTML. They run one
+# findall each rather than as one alternation: a fused regex consumes text that a later pattern
+# would have rescanned, and loses the closing quote some of these require after the digits
+_VIDEO_ID_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'data-asset-id="(\d{8,})"',
+    r'data-video-id="(\d{8,})"',
+    r'data-id="(\d{8,})"',
+    r'id="asset-(\d{8,})"',
+    r'asset-id-(\d{8,})',
+    r'/(\d{8,})/preview',
+    r'/(\d{8,})/comp',
+    r'asset_id["\']?\s*:\s*["\']?(\d{8,})["\']?',
+    r'"id":\s*"?(\d{8,})"?',
+    r'stock\.adobe\.com/.*?/(\d{8,})',
+    r'asset/(\d{8,})',
+    r'video/(\d{8,})',
+    r'Download/Watermarked/(\d{8,})',
+))
+
+# Broader set of ID patterns for the regex fallback extraction
+_VIDEO_ID_PATTERNS_EXT = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'data-asset-id="(\d{8,})"',
+    r'data-video-id="(\d{8,})"',
+    r'data-id="(\d{8,})"',
+    r'id="asset-(\d{8,})"',
+    r'asset-id-(\d{8,})',
+    r'/video/(\d{8,})',
+    r'/asset/(\d{8,})',
+    r'asset_id["\']?\s*:\s*["\']?(\d{8,})["\']?',
+    r'"id":\s*"?(\d{8,})"?',
+    r'stock\.adobe\.com/.*?/(\d{8,})',
+    r'Download/Watermarked/(\d{8,})',
+    # Additional patterns for Adobe Stock video IDs
+    r'video-(\d{8,})',
+    r'content-(\d{8,})',
+    r'media-(\d{8,})',
+))
+
+# Embedded JSON blobs that may contain search results, tried in order. Each pattern stops at
+# the opening bracket and the value is read with _JSON_DECODER.raw_decode, which consumes
+# exactly one complete object or array (nested brackets and brackets inside strings included)
+_JSON_DATA_PATTERNS = tuple((re.compile(pattern), name) for pattern, name in (
+    (r'window\.__INITIAL_STATE__\s*=\s*(?={)', 'INITIAL_STATE'),
+    (r'window\.INITIAL_STATE\s*=\s*(?={)', 'INITIAL_STATE_alt'),
+    (r'__APOLLO_STATE__["\']?\s*:\s*(?={)', 'APOLLO_STATE'),
+    (r'window\.APOLLO_STATE\s*=\s*(?={)', 'APOLLO_STATE_alt'),
+    (r'"searchResults":\s*(?={)', 'searchResults'),
+    (r'"assets":\s*(?=\[)', 'assets'),
+    (r'"videos":\s*(?=\[)', 'videos'),
+    (r'"results":\s*(?=\[)', 'results'),
+))
+_JSON_DECODER = json.JSONDecoder()
+
+# Video records embedded in page JavaScript, from most to least specific:
+# "video_id":{...,"content_id":video_id,...,"title":...,"comp_file_path":...}
+_JS_VIDEO_RECORD_RE = re.compile(r'"(\d{8,})":\s*\{\s*"[^"]*":\s*"[^"]*",\s*"content_id":\s*\1[^}]*?"title":\s*"([^"]+)"[^}]*?"comp_file_path":\s*"([^"]+)"[^}]*?\}', re.DOTALL)
+# "content_id":video_id,...,"title":...,"comp_file_path":...
+_JS_CONTENT_ID_COMP_RE = re.compile(r'"content_id":\s*(\d{8,})[^}]*?"title":\s*"([^"]+)"[^}]*?"comp_file_path":\s*"([^"]+)"', re.DOTALL)
+# "content_id":video_id with a "title" close by
+_JS_CONTENT_ID_TITLE_RE = re.compile(r'"content_id":\s*(\d{8,})[^}]{1,500}?"title":\s*"([^"]+)"', re.DOTALL)
+
+# Element attribute ID helpers
+_ID_PREFIX_RE = re.compile(r'^(asset-|video-)')
+_URL_ID_RE = re.compile(r'/(?:video|asset)/(\d{8,})')
+_DIGITS_ID_RE = re.compile(r'(\d{8,})')
+
+# Raw-HTML markers, one of which every soup selector needs. HTML tag and attribute names are
+# case-insensitive, so the probe is too
+_SOUP_MARKERS_RE = re.compile(
+    r'data-video-preview-url|data-comp-url|js-glyph-video|video-thumbnail|data-asset-type|<video',
+    re.IGNORECASE,
+)
+
+# Known locations of search results inside embedded JSON state, tried in order
+_JSON_SEARCH_PATHS = (
+    ('search', 'results'),
+    ('searchResults',),
+    ('data', 'search', 'results'),
+    ('assets',),
+    ('items',),
+    ('results',),
+    ('videos',),
+    ('data', 'assets'),
+    ('data', 'videos'),
+    ('data', 'results'),
+    ('response', 'results'),
+    ('content', 'results'),
+)
+
+def _build_json_path_walker(paths):
+    """
+    Generate a walker that yields the non-empty value at each path in order.
+    
+    Each path is unrolled into straight-line subscripts so no per-segment
+    loop runs at parse time.
+    
+    Args:
+        paths: Tuple of key tuples to look up
+        
+    Returns:
+        Generator function taking the decoded JSON data
+    """
+    lines = ["def _walk(d):"]
+    for path in paths:
+        lines.append("    try:")
+        lines.append("        v = d" + "".join(f"[{key!r}]" for key in path))
+        lines.append("    except (KeyError, TypeError, IndexError):")
+        lines.append("        v = None")
+        lines.append("    if v:")
+        lines.append("        yield v")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace['_walk']
+
+_walk_json_search_paths = _build_json_path_walker(_JSON_SEARCH_PATHS)
+
+# Filename cleaning: drop special characters except spaces and hyphens, then turn runs of
+# spaces and hyphens into single underscores
+_UNSAFE_NAME_CHARS_RE = re.compile(r'[^\w\s-]')
+_NAME_SEPARATORS_RE = re.compile(r'[-\s]+')
+
+# Video IDs embedded in downloaded filenames: NAME_VIDEOID, VIDEOID_NAME, Adobe_Stock_Video_VIDEOID
+_FILENAME_ID_PATTERNS = (
+    re.compile(r'_(\d{8,})$'),
+    re.compile(r'^(\d{8,})_'),
+    re.compile(r'Adobe_Stock_Video_(\d{8,})'),
+)
+
+# Extensions counted as downloaded videos
+_VIDEO_EXTENSIONS = ('.mp4', '.mov', '.webm', '.avi', '.mkv')
+
+def _list_video_filenames(directory) -> List[str]:
+    """
+    List the video filenames in a directory with a single scandir pass.
+    
+    Matches what a '*<ext>' glob per video extension would, without a directory
+    walk per extension or a Path object per entry.
+    
+    Args:
+        directory: Directory to list
+        
+    Returns:
+        List of video filenames (names only, not paths)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [entry.name for entry in entries if entry.name.endswith(_VIDEO_EXTENSIONS)]
+    except FileNotFoundError:
+        return []
+
+def _clean_name(text: str) -> str:
+    """Make a title or query safe for use in file and directory names."""
+    return _NAME_SEPARATORS_RE.sub('_', _UNSAFE_NAME_CHARS_RE.sub('', text)).strip('_')
+
+# Asset type fields and the (lowercase) values that mark a JSON item as a video
+_ASSET_TYPE_KEYS = ('asset_type', 'content_type', 'media_type')
+_VIDEO_ASSET_TYPES = frozenset(('video', 'videos', 'motion'))
+
+# Shared immutable tags value for records without tags (tags are only read, never appended to)
+_EMPTY_TAGS = ()
+
+def _build_video_record(video_id: str, title: Optional[str] = None, url: Optional[str] = None) -> Dict:
+    """Build the standard video data dictionary for an ID, defaulting to the watermarked URL."""
+    url = url or f'https://stock.adobe.com/Download/Watermarked/{video_id}'
+    return {
+        'id': video_id,
+        'title': title or f'Adobe_Stock_Video_{video_id}',
+        'thumbnail_url': None,
+        'preview_url': url,
+        'comp_url': url,
+        'description': '',
+        'tags': _EMPTY_TAGS,
+        'duration_seconds': None
+    }
+
 class AdobeStockScraper:
     def __init__(self, download_dir: str = "downloads", delay: float = 1.0, use_auth: bool = True, 
                  max_duration_seconds: int = None, min_duration_seconds: int = None, exclude_title_patterns: List[str] = None, 
                  json_output: bool = False, intended_label: str = None, max_size_bytes: int = None, sample_from: int = None,
-                 ignore_list_path: str = None, query: str = None, random_mode: bool = False, use_ignore_list: bool = True):
+                 ignore_list_path: str = None, query: str = None, random_mode: bool = False, use_ignore_list: bool = True,
+                 max_workers: int = 4):
         """
         Initialize the Adobe Stock scraper.
         
@@ -135,6 +358,7 @@ class AdobeStockScraper:
             query: Search query (used to determine query-specific ignore list if ignore_list_path is None)
             random_mode: Whether to scrape completely random videos from various categories (default: False)
             use_ignore_list: Whether to use ignore list functionality (default: True)
+            max_workers: Number of concurrent search page fetches and video downloads (default: 4)
         """
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(exist_ok=True)
@@ -143,13 +367,26 @@ class AdobeStockScraper:
         self.max_duration_seconds = max_duration_seconds
         self.min_duration_seconds = min_duration_seconds
         self.exclude_title_patterns = exclude_title_patterns or []
+        # One alternation over the lowercased patterns, so each title is scanned once
+        self._exclude_title_re = re.compile('|'.join(re.escape(pattern.lower()) for pattern in self.exclude_title_patterns)) if self.exclude_title_patterns else None
         self.json_output = json_output
         self.intended_label = intended_label
         self.max_size_bytes = max_size_bytes
         self.sample_from = sample_from
         self.random_mode = random_mode
         self.use_ignore_list = use_ignore_list
+        self.max_workers = max(1, max_workers)
+        self._download_rate_lock = threading.Lock()
+        self._next_download_at = 0.0  # time.monotonic() before which no new download may start
+        self._ffprobe_path = shutil.which('ffprobe')  # Resolved once; None when ffprobe is not installed
         self.session = requests.Session()
+        
+        # Reuse pooled keep-alive connections to stock.adobe.com and retry transient failures
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         self.authenticated = False
         self.cookies_file = Path("adobe_stock_cookies.json")
         self.current_query = query  # Store current query for ignore list determination
@@ -216,7 +453,7 @@ class AdobeStockScraper:
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Sec-Fetch-Dest': 'document',
@@ -316,18 +553,12 @@ class AdobeStockScraper:
         # Update download directory to the random subdirectory
         self.download_dir = random_dir
         
-        # Load existing video IDs to prevent duplicates
-        existing_video_ids = self.load_existing_video_ids(random_dir)
+        # Load existing video IDs to prevent duplicates, sharing one directory listing with the count
+        existing_filenames = _list_video_filenames(random_dir)
+        existing_video_ids = self.load_existing_video_ids(random_dir, existing_filenames)
         
         # Count existing video files
-        video_extensions = ['.mp4', '.mov', '.webm', '.avi', '.mkv']
-        existing_files = []
-        for ext in video_extensions:
-            existing_files.extend(random_dir.glob(f"*{ext}"))
-        
-        # Filter out metadata files
-        existing_files = [f for f in existing_files if f.name != "random_metadata.json"]
-        existing_count = len(existing_files)
+        existing_count = len(existing_filenames)
         
         if existing_count > 0:
             print(f"Found {existing_count} existing random videos")
@@ -383,11 +614,9 @@ class AdobeStockScraper:
                     self.logger.debug(f"No videos found for category: {query}")
                     continue
                 
-                # Filter and process videos
+                # Filter the category's results down to download candidates
+                candidate_videos = []
                 for video in videos:
-                    if successful_downloads >= needed_count:
-                        break
-                    
                     # Skip if duplicate or in ignore list
                     if self.is_duplicate_video(video):
                         continue
@@ -397,27 +626,39 @@ class AdobeStockScraper:
                         total_filtered_count += 1
                         continue
                     
-                    total_videos_processed += 1
-                    
-                    # Add to global tracking
-                    self.global_seen_video_ids.add(str(video.get('id', '')))
-                    
-                    # Try to download the video
-                    success, filename = self.download_video(video, index=successful_downloads + 1)
-                    if success:
-                        successful_downloads += 1
-                        # Store the mapping between video ID and filename
-                        video_filename_mapping[video['id']] = {
-                            'filename': filename,
-                            'title': video['title'],
-                            'url': video.get('comp_url') or video.get('preview_url') or f'https://stock.adobe.com/Download/Watermarked/{video["id"]}',
-                            'download_timestamp': time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
-                            'category': query,
-                            'random_mode': True
-                        }
-                    
-                    # Rate limiting between downloads
-                    time.sleep(self.delay)
+                    candidate_videos.append(video)
+                
+                # Download the candidates, up to max_workers at a time and never more than are still needed
+                pending_candidates = deque(candidate_videos)
+                in_flight = {}  # future -> video
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    while pending_candidates or in_flight:
+                        while (pending_candidates and len(in_flight) < self.max_workers
+                               and successful_downloads + len(in_flight) < needed_count):
+                            video = pending_candidates.popleft()
+                            total_videos_processed += 1
+                            # Add to global tracking
+                            self.global_seen_video_ids.add(str(video.get('id', '')))
+                            in_flight[executor.submit(self._rate_limited_download, video)] = video
+                        
+                        if not in_flight:
+                            break
+                        
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            video = in_flight.pop(future)
+                            success, filename = future.result()
+                            if success:
+                                successful_downloads += 1
+                                # Store the mapping between video ID and filename
+                                video_filename_mapping[video['id']] = {
+                                    'filename': filename,
+                                    'title': video['title'],
+                                    'url': video.get('comp_url') or video.get('preview_url') or f'https://stock.adobe.com/Download/Watermarked/{video["id"]}',
+                                    'download_timestamp': time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
+                                    'category': query,
+                                    'random_mode': True
+                                }
                 
                 # Rate limiting between categories
                 time.sleep(self.delay)
@@ -432,12 +673,13 @@ class AdobeStockScraper:
                     warning_msg += f"\n         Large ignore list ({ignore_list_size} IDs) may have limited available unique results."
                 print(warning_msg)
             
-            # Update metadata for random videos
+            # Update metadata for random videos (one timestamp shared by every field written now)
+            now = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
             metadata = {
                 "mode": "random",
                 "requested_count": count,
-                "created_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
-                "last_updated": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
+                "created_at": now,
+                "last_updated": now,
                 "total_videos_downloaded": total_files,
                 "categories_used": queries_used,
                 "last_download_session": {
@@ -447,7 +689,7 @@ class AdobeStockScraper:
                     "videos_filtered_out": total_filtered_count,
                     "categories_searched": len(queries_used),
                     "ignore_list_size": ignore_list_size,
-                    "session_timestamp": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+                    "session_timestamp": now
                 },
                 "search_parameters": {
                     "max_duration_seconds": self.max_duration_seconds,
@@ -470,8 +712,7 @@ class AdobeStockScraper:
             
             # Save metadata
             try:
-                with open(metadata_file, 'w', encoding='utf-8') as f:
-                    json.dump(metadata, f, indent=2, ensure_ascii=False)
+                _write_text_atomic(metadata_file, _json_dumps(metadata))
                 
                 self.logger.debug(f"Updated random metadata with {len(video_filename_mapping)} new video file mappings")
             except Exception as e:
@@ -700,9 +941,7 @@ class AdobeStockScraper:
             Path to the query-specific ignore list file
         """
         # Clean the query using the same logic as add_to_ignore_list.py
-        clean_query = re.sub(r'[^\w\s-]', '', query)  # Remove special characters except spaces and hyphens
-        clean_query = re.sub(r'[-\s]+', '_', clean_query)  # Replace spaces and hyphens with underscores
-        clean_query = clean_query.lower().strip('_')  # Lowercase and remove leading/trailing underscores
+        clean_query = _clean_name(query).lower()
         
         if not clean_query:
             clean_query = 'unknown_query'
@@ -713,12 +952,13 @@ class AdobeStockScraper:
         
         return str(ignore_list_dir / f"{clean_query}_ignore_list.json")
 
-    def load_existing_video_ids(self, query_dir: Path) -> set:
+    def load_existing_video_ids(self, query_dir: Path, video_filenames: Optional[List[str]] = None) -> set:
         """
         Load video IDs from existing files and metadata to prevent duplicates.
         
         Args:
             query_dir: Directory to check for existing videos
+            video_filenames: Video filenames already listed from query_dir (listed here if None)
             
         Returns:
             Set of existing video IDs
@@ -727,50 +967,33 @@ class AdobeStockScraper:
         
         # Method 1: Load from metadata file if it exists
         metadata_file = query_dir / "query_metadata.json"
-        if metadata_file.exists():
-            try:
-                with open(metadata_file, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
-                    video_mappings = metadata.get("video_file_mappings", {})
-                    for video_id in video_mappings.keys():
-                        existing_ids.add(str(video_id))
-                        
-                self.logger.debug(f"Loaded {len(existing_ids)} video IDs from metadata file")
-            except (json.JSONDecodeError, KeyError, FileNotFoundError) as e:
-                self.logger.warning(f"Could not load video IDs from metadata: {e}")
+        try:
+            with open(metadata_file, 'rb') as f:
+                metadata = _json_loads(f.read())
+                video_mappings = metadata.get("video_file_mappings", {})
+                for video_id in video_mappings.keys():
+                    existing_ids.add(str(video_id))
+                    
+            self.logger.debug(f"Loaded {len(existing_ids)} video IDs from metadata file")
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, KeyError) as e:
+            self.logger.warning(f"Could not load video IDs from metadata: {e}")
         
         # Method 2: Try to extract video IDs from existing filenames
-        if query_dir.exists():
-            video_extensions = ['*.mp4', '*.mov', '*.webm', '*.avi', '*.mkv']
-            existing_files = []
-            for ext in video_extensions:
-                existing_files.extend(query_dir.glob(ext))
-            
+        if video_filenames is None:
+            video_filenames = _list_video_filenames(query_dir)
+        if video_filenames:
             filename_extracted_ids = set()
-            for file_path in existing_files:
-                filename = file_path.stem  # Get filename without extension
+            for existing_name in video_filenames:
+                filename = os.path.splitext(existing_name)[0]  # Get filename without extension
                 
                 # Try to extract Adobe Stock video ID from filename
-                # Pattern 1: Filename ending with _VIDEOID
-                id_match = re.search(r'_(\d{8,})$', filename)
-                if id_match:
-                    video_id = id_match.group(1)
-                    filename_extracted_ids.add(video_id)
-                    continue
-                
-                # Pattern 2: Filename starting with VIDEOID_
-                id_match = re.search(r'^(\d{8,})_', filename)
-                if id_match:
-                    video_id = id_match.group(1)
-                    filename_extracted_ids.add(video_id)
-                    continue
-                
-                # Pattern 3: Adobe_Stock_Video_VIDEOID
-                id_match = re.search(r'Adobe_Stock_Video_(\d{8,})', filename)
-                if id_match:
-                    video_id = id_match.group(1)
-                    filename_extracted_ids.add(video_id)
-                    continue
+                for id_pattern in _FILENAME_ID_PATTERNS:
+                    id_match = id_pattern.search(filename)
+                    if id_match:
+                        filename_extracted_ids.add(id_match.group(1))
+                        break
             
             if filename_extracted_ids:
                 self.logger.debug(f"Extracted {len(filename_extracted_ids)} video IDs from existing filenames")
@@ -857,8 +1080,11 @@ class AdobeStockScraper:
             self.logger.info(f"Navigating to {login_url}")
             driver.get(login_url)
             
-            # Wait a moment for page to load
-            time.sleep(3)
+            # Wait for the page body instead of a fixed pause, so the prompt appears as soon as it loads
+            try:
+                WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            except TimeoutException:
+                self.logger.debug("Login page is still loading; continuing to the login prompt")
             
             print("\n" + "="*60)
             print("🌐 BROWSER OPENED FOR ADOBE STOCK LOGIN")
@@ -898,8 +1124,8 @@ class AdobeStockScraper:
             self.session.cookies.update(cookies_dict)
             
             # Test authentication by accessing a protected page
-            test_response = self.session.get("https://stock.adobe.com/search")
-            if test_response.status_code == 200:
+            test_status = self.session.head("https://stock.adobe.com/search", timeout=10, allow_redirects=True).status_code
+            if test_status == 200:
                 self.authenticated = True
                 self.logger.info("✅ Authentication successful!")
                 print("\n✅ Authentication successful! You can now close the browser.")
@@ -931,8 +1157,8 @@ class AdobeStockScraper:
             return False
         
         try:
-            with open(self.cookies_file, 'r') as f:
-                cookies = json.load(f)
+            with open(self.cookies_file, 'rb') as f:
+                cookies = _json_loads(f.read())
             
             self.session.cookies.update(cookies)
             self.authenticated = True
@@ -954,8 +1180,8 @@ class AdobeStockScraper:
             True if saved successfully, False otherwise
         """
         try:
-            with open(self.cookies_file, 'w') as f:
-                json.dump(cookies, f, indent=2)
+            with open(self.cookies_file, 'w', encoding='utf-8') as f:
+                f.write(_json_dumps(cookies))
             
             self.logger.debug(f"Saved {len(cookies)} cookies to {self.cookies_file}")
             return True
@@ -972,10 +1198,11 @@ class AdobeStockScraper:
             True if authenticated, False otherwise
         """
         try:
-            response = self.session.get("https://stock.adobe.com/search", timeout=10)
+            # Only the status code is inspected, so a HEAD request skips the page body while
+            # leaving the connection reusable for the next request
+            status_code = self.session.head("https://stock.adobe.com/search", timeout=10, allow_redirects=True).status_code
             
-            # Check for login indicators in the response
-            if response.status_code == 200:
+            if status_code == 200:
                 # Success - likely authenticated or public access
                 self.authenticated = True
                 return True
@@ -1001,9 +1228,10 @@ class AdobeStockScraper:
         title = video_data.get('title', '').lower()
         
         # Check title exclusion patterns
-        for pattern in self.exclude_title_patterns:
-            if pattern.lower() in title:
-                self.logger.debug(f"Filtering out video '{video_data.get('title', '')}' - matches exclusion pattern: '{pattern}'")
+        if self._exclude_title_re is not None:
+            match = self._exclude_title_re.search(title)
+            if match:
+                self.logger.debug(f"Filtering out video '{video_data.get('title', '')}' - matches exclusion pattern: '{match.group()}'")
                 return True
         
         # Check duration if available (Note: Adobe Stock may not provide duration in search results)
@@ -1069,140 +1297,127 @@ class AdobeStockScraper:
         
         consecutive_empty_pages = 0  # Track empty pages to stop early
         
+        # Request only as many results per page as this search is likely to need (3x oversample
+        # to allow for duplicates and ignored videos). The size is fixed for the whole search so
+        # page offsets stay consistent across search_page values.
+        page_size = min(200, max(20, limit * 3))
+        
+        # max_pages was sized for 200-result pages; scale it up for smaller pages so a search still
+        # looks through as many results. An empty page means results ran out at any page size, so
+        # consecutive_empty_limit stays as it is
+        max_pages *= -(-200 // page_size)
+        
         self.logger.debug(f"Starting search with {len(self.global_seen_video_ids)} previously seen video IDs")
         
-        while len(videos) < limit and page <= max_pages and consecutive_empty_pages < consecutive_empty_limit:
-            self.logger.debug(f"Searching page {page} for query: '{query}' (need {limit - len(videos)} more videos)")
-            
-            # Use only the working Adobe Stock URL pattern
-            search_urls = [
-                "https://stock.adobe.com/search/video",
-            ]
-            # Every Adobe Stock video uses the pattern: https://stock.adobe.com/Download/Watermarked/video_id
-            # The video_id is extracted from the HTML content of the search results page
-            
-            # Add pagination parameters
-            params = {
-                'k': query,
-                'content_type:video': '1',
-                'order': 'relevance',
-                'safe_search': '1',
-                'search_page': page,  # Add page parameter
-                'limit': '200',  # Request more results per page
-            }
-            
-            page_videos = []
-            for url in search_urls:
-                try:
-                    response = self.session.get(url, params=params, timeout=30)
-                    response.raise_for_status()
-                    
-                    self.logger.debug(f"Got response from {url}, status: {response.status_code}")
-                    
-                    # Look for JSON data in the page
-                    page_videos = self._extract_video_data(response.text)
-                    
-                    if page_videos:
-                        self.logger.debug(f"Found {len(page_videos)} videos using {url}")
-                        # Debug: Log the first few video IDs found
-                        if page_videos:
-                            sample_ids = [v.get('id', 'no-id') for v in page_videos[:3]]
-                            self.logger.debug(f"Sample video IDs from extraction: {sample_ids}")
-                        break
-                    else:
-                        self.logger.debug(f"No videos found using {url}")
-                        
-                except requests.RequestException as e:
-                    self.logger.error(f"Error with {url}: {e}")
-                    continue
-            
-            if not page_videos:
-                self.logger.debug(f"No videos found on page {page}")
-                consecutive_empty_pages += 1
-            else:
-                consecutive_empty_pages = 0
+        # Keep up to max_workers pages downloading and parsing in worker threads while
+        # finished pages are processed here in page order, so duplicate tracking behaves as before
+        pending_pages = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while len(videos) < limit and consecutive_empty_pages < consecutive_empty_limit:
+                while page <= max_pages and len(pending_pages) < self.max_workers:
+                    pending_pages.append((page, executor.submit(self._fetch_search_page, query, page, page_size)))
+                    page += 1
                 
-                # Enhanced duplicate filtering with multiple checks
-                new_videos = []
-                duplicates_filtered = 0
-                invalid_videos_filtered = 0
-                ignored_videos_filtered = 0
+                if not pending_pages:
+                    break
                 
-                # Debug: Log current tracking state
-                self.logger.debug(f"Before processing page {page}: global_seen_video_ids has {len(self.global_seen_video_ids)} IDs")
-                if len(self.global_seen_video_ids) <= 10:
-                    self.logger.debug(f"Current global_seen_video_ids: {list(self.global_seen_video_ids)}")
+                current_page, future = pending_pages.popleft()
+                self.logger.debug(f"Processing page {current_page} for query: '{query}' (need {limit - len(videos)} more videos)")
+                page_videos = future.result()
                 
-                for video in page_videos:
-                    video_id = video.get('id')
-                    
-                    # Skip videos without valid IDs
-                    if not video_id or not str(video_id).strip():
-                        invalid_videos_filtered += 1
-                        continue
-                    
-                    video_id = str(video_id).strip()
+                if not page_videos:
+                    self.logger.debug(f"No videos found on page {current_page}")
+                    consecutive_empty_pages += 1
+                else:
+                    consecutive_empty_pages = 0
                     
-                    # Debug: Log checking process for first few videos
-                    if len(new_videos) < 3:
-                        self.logger.debug(f"Checking video {video_id}: in seen_video_ids={video_id in seen_video_ids}, in global_seen_video_ids={video_id in self.global_seen_video_ids}, in ignore_list={video_id in self.current_ignored_video_ids if self.use_ignore_list else False}")
+                    # Enhanced duplicate filtering with multiple checks
+                    new_videos = []
+                    duplicates_filtered = 0
+                    invalid_videos_filtered = 0
+                    ignored_videos_filtered = 0
                     
-                    # Check against ignore list first (if enabled)
-                    if self.use_ignore_list and video_id in self.current_ignored_video_ids:
-                        ignored_videos_filtered += 1
-                        if len(new_videos) < 3:  # Debug first few
-                            self.logger.debug(f"Video {video_id} is in ignore list - skipping")
-                        continue
+                    # Debug: Log current tracking state
+                    self.logger.debug(f"Before processing page {current_page}: global_seen_video_ids has {len(self.global_seen_video_ids)} IDs")
+                    if len(self.global_seen_video_ids) <= 10:
+                        self.logger.debug(f"Current global_seen_video_ids: {list(self.global_seen_video_ids)}")
                     
-                    # Check against multiple duplicate sources:
-                    # 1. Current search session duplicates
-                    # 2. Global seen video IDs (includes existing files)
-                    if video_id in seen_video_ids:
-                        duplicates_filtered += 1
-                        self.logger.debug(f"Duplicate in current search: {video_id}")
-                        continue
+                    for video in page_videos:
+                        video_id = video.get('id')
+                        
+                        # Skip videos without valid IDs
+                        if not video_id or not str(video_id).strip():
+                            invalid_videos_filtered += 1
+                            continue
+                        
+                        video_id = str(video_id).strip()
+                        
+                        # Debug: Log checking process for first few videos
+                        if len(new_videos) < 3:
+                            self.logger.debug(f"Checking video {video_id}: in seen_video_ids={video_id in seen_video_ids}, in global_seen_video_ids={video_id in self.global_seen_video_ids}, in ignore_list={video_id in self.current_ignored_video_ids if self.use_ignore_list else False}")
+                        
+                        # Check against ignore list first (if enabled)
+                        if self.use_ignore_list and video_id in self.current_ignored_video_ids:
+                            ignored_videos_filtered += 1
+                            if len(new_videos) < 3:  # Debug first few
+                                self.logger.debug(f"Video {video_id} is in ignore list - skipping")
+                            continue
+                        
+                        # Check against multiple duplicate sources:
+                        # 1. Current search session duplicates
+                        # 2. Global seen video IDs (includes existing files)
+                        if video_id in seen_video_ids:
+                            duplicates_filtered += 1
+                            self.logger.debug(f"Duplicate in current search: {video_id}")
+                            continue
+                        
+                        if video_id in self.global_seen_video_ids:
+                            duplicates_filtered += 1
+                            if len(new_videos) < 3:  # Debug first few
+                                self.logger.debug(f"Video {video_id} already in global_seen_video_ids - marking as duplicate")
+                            continue
+                        
+                        # Add to tracking sets - this is the single point where we add to global tracking
+                        seen_video_ids.add(video_id)
+                        self.global_seen_video_ids.add(video_id)
+                        
+                        # Add video to results
+                        new_videos.append(video)
                     
-                    if video_id in self.global_seen_video_ids:
-                        duplicates_filtered += 1
-                        if len(new_videos) < 3:  # Debug first few
-                            self.logger.debug(f"Video {video_id} already in global_seen_video_ids - marking as duplicate")
-                        continue
+                    videos.extend(new_videos)
                     
-                    # Add to tracking sets - this is the single point where we add to global tracking
-                    seen_video_ids.add(video_id)
-                    self.global_seen_video_ids.add(video_id)
+                    # Enhanced logging
+                    total_filtered = duplicates_filtered + invalid_videos_filtered + ignored_videos_filtered
+                    if total_filtered > 0:
+                        filter_details = []
+                        if duplicates_filtered > 0:
+                            filter_details.append(f"{duplicates_filtered} duplicates")
+                        if invalid_videos_filtered > 0:
+                            filter_details.append(f"{invalid_videos_filtered} invalid")
+                        if ignored_videos_filtered > 0:
+                            filter_details.append(f"{ignored_videos_filtered} ignored")
+                        
+                        self.logger.debug(f"Page {current_page}: Found {len(new_videos)} new unique videos, filtered {', '.join(filter_details)}")
+                    else:
+                        self.logger.debug(f"Page {current_page}: Found {len(new_videos)} new unique videos")
                     
-                    # Add video to results
-                    new_videos.append(video)
-                
-                videos.extend(new_videos)
-                
-                # Enhanced logging
-                total_filtered = duplicates_filtered + invalid_videos_filtered + ignored_videos_filtered
-                if total_filtered > 0:
-                    filter_details = []
-                    if duplicates_filtered > 0:
-                        filter_details.append(f"{duplicates_filtered} duplicates")
-                    if invalid_videos_filtered > 0:
-                        filter_details.append(f"{invalid_videos_filtered} invalid")
+                    # Special handling when ignore list is large
                     if ignored_videos_filtered > 0:
-                        filter_details.append(f"{ignored_videos_filtered} ignored")
+                        self.logger.debug(f"🚫 Skipped {ignored_videos_filtered} videos from ignore list on page {current_page}")
                     
-                    self.logger.debug(f"Page {page}: Found {len(new_videos)} new unique videos, filtered {', '.join(filter_details)}")
-                else:
-                    self.logger.debug(f"Page {page}: Found {len(new_videos)} new unique videos")
+                    # If we got no new videos on this page, it might mean we've seen them all
+                    if len(new_videos) == 0:
+                        consecutive_empty_pages += 1
+                        self.logger.debug(f"No new videos on page {current_page} - all were duplicates, invalid, or ignored")
                 
-                # Special handling when ignore list is large
-                if ignored_videos_filtered > 0:
-                    self.logger.debug(f"🚫 Skipped {ignored_videos_filtered} videos from ignore list on page {page}")
+                if len(videos) >= limit:
+                    break
                 
-                # If we got no new videos on this page, it might mean we've seen them all
-                if len(new_videos) == 0:
-                    consecutive_empty_pages += 1
-                    self.logger.debug(f"No new videos on page {page} - all were duplicates, invalid, or ignored")
+                time.sleep(self.delay / self.max_workers)  # Rate limiting, spread across the in-flight pages
             
-            page += 1
-            time.sleep(self.delay)  # Rate limiting
+            # Drop queued pages that are no longer needed
+            for _, future in pending_pages:
+                future.cancel()
         
         # Enhanced completion logging
         completion_msg = f"Search complete: {len(videos)} unique videos found"
@@ -1219,6 +1434,80 @@ class AdobeStockScraper:
         self.logger.debug(completion_msg)
         return videos[:limit]
 
+    def _fetch_search_page(self, query: str, page: int, page_size: int = 200) -> List[Dict]:
+        """
+        Fetch a single search results page and extract its video data.
+
+        Args:
+            query: Search query string
+            page: Search results page number
+            page_size: Number of results to request per page
+
+        Returns:
+            List of video data dictionaries found on the page
+        """
+        # Use only the working Adobe Stock URL pattern
+        search_urls = [
+            "https://stock.adobe.com/search/video",
+        ]
+        # Every Adobe Stock video uses the pattern: https://stock.adobe.com/Download/Watermarked/video_id
+        # The video_id is extracted from the HTML content of the search results page
+
+        # Add pagination parameters
+        params = {
+            'k': query,
+            'content_type:video': '1',
+            'order': 'relevance',
+            'safe_search': '1',
+            'search_page': page,  # Add page parameter
+            'limit': str(page_size),  # Results per page
+        }
+
+        page_videos = []
+        for url in search_urls:
+            try:
+                with self.session.get(url, params=params, timeout=30, stream=True) as response:
+                    response.raise_for_status()
+
+                    self.logger.debug(f"Got response from {url} (page {page}), status: {response.status_code}")
+
+                    # Decode incrementally so the raw bytes and the decoded text are never both held in full
+                    html_content = ''.join(self._iter_decoded(response))
+
+                # Look for JSON data in the page
+                page_videos = self._extract_video_data(html_content)
+
+                if page_videos:
+                    self.logger.debug(f"Found {len(page_videos)} videos using {url}")
+                    # Debug: Log the first few video IDs found
+                    sample_ids = [v.get('id', 'no-id') for v in page_videos[:3]]
+                    self.logger.debug(f"Sample video IDs from extraction: {sample_ids}")
+                    break
+                else:
+                    self.logger.debug(f"No videos found using {url}")
+
+            except requests.RequestException as e:
+                self.logger.error(f"Error with {url}: {e}")
+                continue
+
+        return page_videos
+
+    def _iter_decoded(self, response, chunk_size: int = 65536):
+        """
+        Yield the body of a streamed response as decoded text chunks.
+        
+        Args:
+            response: Response object requested with stream=True
+            chunk_size: Number of bytes read per chunk
+            
+        Returns:
+            Generator of decoded text chunks
+        """
+        # iter_content only decodes when an encoding is known; Adobe Stock pages are UTF-8
+        if response.encoding is None:
+            response.encoding = 'utf-8'
+        yield from response.iter_content(chunk_size=chunk_size, decode_unicode=True)
+
     def _extract_video_data(self, html_content: str) -> List[Dict]:
         """
         Extract video data from Adobe Stock page HTML.
@@ -1239,22 +1528,11 @@ class AdobeStockScraper:
             return videos
         
         # Method 2: Look for various JSON data patterns (fallback)
-        json_patterns = [
-            (r'window\.__INITIAL_STATE__\s*=\s*({.*?});', 'INITIAL_STATE'),
-            (r'window\.INITIAL_STATE\s*=\s*({.*?});', 'INITIAL_STATE_alt'),
-            (r'__APOLLO_STATE__["\']?\s*:\s*({.*?})', 'APOLLO_STATE'),
-            (r'window\.APOLLO_STATE\s*=\s*({.*?});', 'APOLLO_STATE_alt'),
-            (r'"searchResults":\s*({.*?})', 'searchResults'),
-            (r'"assets":\s*(\[.*?\])', 'assets'),
-            (r'"videos":\s*(\[.*?\])', 'videos'),
-            (r'"results":\s*(\[.*?\])', 'results'),
-        ]
-        
-        for pattern, name in json_patterns:
-            json_match = re.search(pattern, html_content, re.DOTALL)
+        for pattern, name in _JSON_DATA_PATTERNS:
+            json_match = pattern.search(html_content)
             if json_match:
                 try:
-                    data = json.loads(json_match.group(1))
+                    data, _ = _JSON_DECODER.raw_decode(html_content, json_match.end())
                     extracted = self._parse_json_data(data)
                     if extracted:
                         videos.extend(extracted)
@@ -1284,61 +1562,24 @@ class AdobeStockScraper:
         Returns:
             List of video data dictionaries
         """
-        videos = []
-        
         # Look for the specific video data structure: "video_id":{"content_id":video_id,"title":"title"...}
         # Pattern 1: More specific pattern for the video data
-        pattern1 = r'"(\d{8,})":\s*\{\s*"[^"]*":\s*"[^"]*",\s*"content_id":\s*\1[^}]*?"title":\s*"([^"]+)"[^}]*?"comp_file_path":\s*"([^"]+)"[^}]*?\}'
-        
-        matches = re.findall(pattern1, html_content, re.DOTALL)
-        
-        for video_id, title, comp_path in matches:
-            video_info = {
-                'id': video_id,
-                'title': title[:150],  # Limit title length
-                'thumbnail_url': None,
-                'preview_url': comp_path,
-                'comp_url': comp_path,
-                'description': '',
-                'tags': []
-            }
-            videos.append(video_info)
+        matches = _JS_VIDEO_RECORD_RE.findall(html_content)
+        
+        # Titles are limited to 150 characters
+        videos = [_build_video_record(video_id, title[:150], comp_path) for video_id, title, comp_path in matches]
         
         # Pattern 2: Simpler pattern just looking for title associated with content_id
         if not videos:
-            pattern2 = r'"content_id":\s*(\d{8,})[^}]*?"title":\s*"([^"]+)"[^}]*?"comp_file_path":\s*"([^"]+)"'
-            
-            matches = re.findall(pattern2, html_content, re.DOTALL)
-            
-            for video_id, title, comp_path in matches:
-                video_info = {
-                    'id': video_id,
-                    'title': title[:150],  # Limit title length
-                    'thumbnail_url': None,
-                    'preview_url': comp_path,
-                    'comp_url': comp_path,
-                    'description': '',
-                    'tags': []
-                }
-                videos.append(video_info)
+            matches = _JS_CONTENT_ID_COMP_RE.findall(html_content)
+            
+            videos = [_build_video_record(video_id, title[:150], comp_path) for video_id, title, comp_path in matches]
         
         # Pattern 3: Even simpler - just find title near content_id
         if not videos:
-            pattern3 = r'"content_id":\s*(\d{8,})[^}]{1,500}?"title":\s*"([^"]+)"'
-            
-            matches = re.findall(pattern3, html_content, re.DOTALL)
-            
-            for video_id, title in matches:
-                video_info = {
-                    'id': video_id,
-                    'title': title[:150],  # Limit title length
-                    'thumbnail_url': None,
-                    'preview_url': f'https://stock.adobe.com/Download/Watermarked/{video_id}',
-                    'comp_url': f'https://stock.adobe.com/Download/Watermarked/{video_id}',
-                    'description': '',
-                    'tags': []
-                }
-                videos.append(video_info)
+            matches = _JS_CONTENT_ID_TITLE_RE.findall(html_content)
+            
+            videos = [_build_video_record(video_id, title[:150]) for video_id, title in matches]
         
         # Local duplicate check within this extraction only (don't modify global tracking here)
         unique_videos = []
@@ -1366,7 +1607,7 @@ class AdobeStockScraper:
         videos = []
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml')
             
             # Look for various video container patterns in Adobe Stock
             video_selectors = [
@@ -1384,42 +1625,21 @@ class AdobeStockScraper:
             
             seen_ids = set()
             
-            for selector in video_selectors:
-                elements = soup.select(selector)
-                for element in elements:
-                    video_data = self._extract_video_data_from_element(element)
-                    if video_data and video_data['id'] not in seen_ids:
-                        seen_ids.add(video_data['id'])
-                        videos.append(video_data)
-            
-            # If we didn't find videos with the above selectors, try a more general approach
-            if not videos:
-                # Look for any elements with video-related data attributes
-                all_elements = soup.find_all(attrs={'data-asset-id': True})
-                all_elements.extend(soup.find_all(attrs={'data-id': True}))
-                
-                for element in all_elements:
-                    video_data = self._extract_video_data_from_element(element)
-                    if video_data and video_data['id'] not in seen_ids:
-                        seen_ids.add(video_data['id'])
-                        videos.append(video_data)
+            # A selector group walks the tree once and yields each matching element once.
+            # [data-asset-id] and [data-id] are part of the group, so no separate
+            # find_all pass over those attributes is needed
+            for element in soup.select(', '.join(video_selectors)):
+                video_data = self._extract_video_data_from_element(element)
+                if video_data and video_data['id'] not in seen_ids:
+                    seen_ids.add(video_data['id'])
+                    videos.append(video_data)
             
             self.logger.debug(f"Found {len(videos)} unique videos with titles from HTML parsing")
             
         except Exception as e:
             self.logger.error(f"Error in HTML parsing for video titles: {e}")
             # Fallback to just IDs if title extraction fails
-            video_ids = self._extract_video_ids_from_html(html_content)
-            for video_id in video_ids:
-                videos.append({
-                    'id': video_id,
-                    'title': f'Adobe_Stock_Video_{video_id}',
-                    'thumbnail_url': None,
-                    'preview_url': f'https://stock.adobe.com/Download/Watermarked/{video_id}',
-                    'comp_url': f'https://stock.adobe.com/Download/Watermarked/{video_id}',
-                    'description': '',
-                    'tags': []
-                })
+            videos.extend(_build_video_record(video_id) for video_id in self._extract_video_ids_from_html(html_content))
         
         return videos
     
@@ -1441,7 +1661,7 @@ class AdobeStockScraper:
             potential_id = element.get(attr)
             if potential_id:
                 # Clean up the ID (remove prefixes like 'asset-')
-                clean_id = re.sub(r'^(asset-|video-)', '', str(potential_id))
+                clean_id = _ID_PREFIX_RE.sub('', str(potential_id))
                 if clean_id.isdigit() and len(clean_id) >= 8:
                     video_id = clean_id
                     break
@@ -1527,7 +1747,7 @@ class AdobeStockScraper:
             'preview_url': watermarked_url,
             'comp_url': watermarked_url,
             'description': element.get('data-description', ''),
-            'tags': [],
+            'tags': _EMPTY_TAGS,
             'duration_seconds': duration_seconds
         }
     
@@ -1575,30 +1795,9 @@ class AdobeStockScraper:
         """
         video_ids = set()  # Use set to avoid duplicates
         
-        # Pattern 1: Look for video IDs in data attributes
-        patterns = [
-            r'data-asset-id="(\d{8,})"',
-            r'data-video-id="(\d{8,})"',
-            r'data-id="(\d{8,})"',
-            r'id="asset-(\d{8,})"',
-            r'asset-id-(\d{8,})',
-            r'/(\d{8,})/preview',
-            r'/(\d{8,})/comp',
-            r'asset_id["\']?\s*:\s*["\']?(\d{8,})["\']?',
-            r'"id":\s*"?(\d{8,})"?',
-            r'"asset_id":\s*"?(\d{8,})"?',
-            r'stock\.adobe\.com/.*?/(\d{8,})',
-            r'asset/(\d{8,})',
-            r'video/(\d{8,})',
-            r'Download/Watermarked/(\d{8,})',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
-            for match in matches:
-                # Ensure the ID is at least 8 digits (typical Adobe Stock format)
-                if len(match) >= 8 and match.isdigit():
-                    video_ids.add(match)
+        for pattern in _VIDEO_ID_PATTERNS:
+            # The capture group only matches runs of 8+ digits (typical Adobe Stock format)
+            video_ids.update(pattern.findall(html_content))
         
         self.logger.debug(f"Found {len(video_ids)} unique video IDs in HTML")
         return list(video_ids)
@@ -1616,46 +1815,22 @@ class AdobeStockScraper:
             return videos
         
         # Try different JSON structures
-        search_paths = [
-            ['search', 'results'],
-            ['searchResults'],
-            ['data', 'search', 'results'],
-            ['assets'],
-            ['items'],
-            ['results'],
-            ['videos'],
-            ['data', 'assets'],
-            ['data', 'videos'],
-            ['data', 'results'],
-            ['response', 'results'],
-            ['content', 'results'],
-        ]
-        
-        for path in search_paths:
-            current = data
-            for key in path:
-                if isinstance(current, dict) and key in current:
-                    current = current[key]
-                else:
-                    current = None
-                    break
+        for current in _walk_json_search_paths(data):
+            if isinstance(current, dict):
+                # Handle dict of items
+                for item_id, item_data in current.items():
+                    video = self._extract_video_info(item_data, item_id)
+                    if video:
+                        videos.append(video)
+            elif isinstance(current, list):
+                # Handle list of items
+                for i, item_data in enumerate(current):
+                    video = self._extract_video_info(item_data, str(i))
+                    if video:
+                        videos.append(video)
             
-            if current:
-                if isinstance(current, dict):
-                    # Handle dict of items
-                    for item_id, item_data in current.items():
-                        video = self._extract_video_info(item_data, item_id)
-                        if video:
-                            videos.append(video)
-                elif isinstance(current, list):
-                    # Handle list of items
-                    for i, item_data in enumerate(current):
-                        video = self._extract_video_info(item_data, str(i))
-                        if video:
-                            videos.append(video)
-                
-                if videos:
-                    break
+            if videos:
+                break
         
         # If no videos found with standard paths, try to find any nested video data
         if not videos:
@@ -1677,12 +1852,8 @@ class AdobeStockScraper:
             
             if has_video_data:
                 # Check if this looks like a video item
-                asset_type = str(data.get('asset_type', '')).lower()
-                content_type = str(data.get('content_type', '')).lower()
-                media_type = str(data.get('media_type', '')).lower()
-                
-                is_video = any(vid_type in [asset_type, content_type, media_type] 
-                              for vid_type in ['video', 'videos', 'motion'])
+                item_types = {str(data.get(key, '')).lower() for key in _ASSET_TYPE_KEYS}
+                is_video = not item_types.isdisjoint(_VIDEO_ASSET_TYPES)
                 
                 # Also check for video URLs or IDs that suggest it's a video
                 has_video_url = any('video' in str(data.get(key, '')).lower() 
@@ -1711,11 +1882,8 @@ class AdobeStockScraper:
             return None
         
         # Check if this is a video
-        asset_type = item_data.get('asset_type', '').lower()
-        content_type = item_data.get('content_type', '').lower()
-        media_type = item_data.get('media_type', '').lower()
-        
-        if not any(vid_type in [asset_type, content_type, media_type] for vid_type in ['video', 'videos', 'motion']):
+        item_types = {str(item_data.get(key, '')).lower() for key in _ASSET_TYPE_KEYS}
+        if item_types.isdisjoint(_VIDEO_ASSET_TYPES):
             return None
         
         # Extract the actual video ID from the item data
@@ -1774,7 +1942,7 @@ class AdobeStockScraper:
             'preview_url': watermarked_url,
             'comp_url': watermarked_url,
             'description': item_data.get('description', ''),
-            'tags': item_data.get('keywords', item_data.get('tags', [])),
+            'tags': item_data.get('keywords', item_data.get('tags', _EMPTY_TAGS)),
             'duration_seconds': duration_seconds
         }
         
@@ -1792,8 +1960,13 @@ class AdobeStockScraper:
         """
         videos = []
         
+        # Every selector below needs one of these markers in the raw HTML, so skip
+        # building the parse tree entirely when none of them are present
+        if not _SOUP_MARKERS_RE.search(html_content):
+            return videos
+        
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml')
             
             # Look for video elements with data attributes
             video_selectors = [
@@ -1806,20 +1979,28 @@ class AdobeStockScraper:
                 '.search-result[data-asset-type*="video" i]'
             ]
             
+            # Selectors run in priority order and share the 20-record limit. Every element yields a
+            # record, so each select stops matching once the remaining budget is used up
             for selector in video_selectors:
-                elements = soup.select(selector)
-                for i, element in enumerate(elements):
+                remaining = 20 - len(videos)
+                if remaining <= 0:
+                    break
+                for i, element in enumerate(soup.select(selector, limit=remaining)):
                     video_data = self._extract_element_data(element, f"soup_{selector}_{i}")
                     if video_data:
                         videos.append(video_data)
             
+            # The parse tree is full of parent/child reference cycles, so it would otherwise stay
+            # alive until the cyclic garbage collector runs. The records above only hold strings.
+            soup.decompose()
+            
             if videos:
                 self.logger.debug(f"BeautifulSoup found {len(videos)} videos")
             
         except Exception as e:
             self.logger.error(f"Error in BeautifulSoup parsing: {e}")
         
-        return videos[:20]  # Limit results
+        return videos
 
     def _extract_element_data(self, element, element_id: str) -> Optional[Dict]:
         """Extract video data from a BeautifulSoup element."""
@@ -1837,7 +2018,7 @@ class AdobeStockScraper:
             potential_id = attrs.get(attr)
             if potential_id:
                 # Clean up the ID (remove prefixes like 'asset-')
-                clean_id = re.sub(r'^(asset-|video-)', '', potential_id)
+                clean_id = _ID_PREFIX_RE.sub('', potential_id)
                 if clean_id.isdigit() and len(clean_id) >= 8:
                     video_id = clean_id
                     break
@@ -1849,7 +2030,7 @@ class AdobeStockScraper:
                 url = attrs.get(attr, '')
                 if url:
                     # Extract ID from URLs like /video/123456789 or asset/123456789
-                    id_match = re.search(r'/(?:video|asset)/(\d{8,})', url)
+                    id_match = _URL_ID_RE.search(url)
                     if id_match:
                         video_id = id_match.group(1)
                         break
@@ -1857,7 +2038,7 @@ class AdobeStockScraper:
         # Use element_id as fallback
         if not video_id:
             # Try to extract numeric ID from element_id
-            id_match = re.search(r'(\d{8,})', element_id)
+            id_match = _DIGITS_ID_RE.search(element_id)
             if id_match:
                 video_id = id_match.group(1)
             else:
@@ -1909,7 +2090,7 @@ class AdobeStockScraper:
             'preview_url': watermarked_url,
             'comp_url': watermarked_url,
             'description': attrs.get('data-description', ''),
-            'tags': [],
+            'tags': _EMPTY_TAGS,
             'duration_seconds': duration_seconds
         }
 
@@ -1927,46 +2108,12 @@ class AdobeStockScraper:
         video_ids = set()  # Use set to avoid duplicates
         
         # Look for video IDs in various patterns (similar to _extract_video_ids_from_html but broader)
-        video_id_patterns = [
-            r'data-asset-id="(\d{8,})"',
-            r'data-video-id="(\d{8,})"',
-            r'data-id="(\d{8,})"',
-            r'id="asset-(\d{8,})"',
-            r'asset-id-(\d{8,})',
-            r'/video/(\d{8,})',
-            r'/asset/(\d{8,})',
-            r'asset_id["\']?\s*:\s*["\']?(\d{8,})["\']?',
-            r'"id":\s*"?(\d{8,})"?',
-            r'"asset_id":\s*"?(\d{8,})"?',
-            r'stock\.adobe\.com/.*?/(\d{8,})',
-            r'Download/Watermarked/(\d{8,})',
-            # Additional patterns for Adobe Stock video IDs
-            r'video-(\d{8,})',
-            r'content-(\d{8,})',
-            r'media-(\d{8,})',
-        ]
-        
-        for i, pattern in enumerate(video_id_patterns):
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
-            for match in matches:
-                # Ensure the ID is at least 8 digits (typical Adobe Stock format)
-                if len(match) >= 8 and match.isdigit():
-                    video_ids.add(match)
+        for pattern in _VIDEO_ID_PATTERNS_EXT:
+            # The capture group only matches runs of 8+ digits (typical Adobe Stock format)
+            video_ids.update(pattern.findall(html_content))
         
         # Convert to list and create video data structures
-        for j, video_id in enumerate(video_ids):
-            watermarked_url = f'https://stock.adobe.com/Download/Watermarked/{video_id}'
-            video_info = {
-                'id': video_id,
-                'title': f'Adobe_Stock_Video_{video_id}',
-                'thumbnail_url': None,
-                'preview_url': watermarked_url,
-                'comp_url': watermarked_url,
-                'description': '',
-                'tags': [],
-                'duration_seconds': None
-            }
-            videos.append(video_info)
+        videos = [_build_video_record(video_id) for video_id in video_ids]
         
         if videos:
             self.logger.debug(f"Regex extraction found {len(videos)} video IDs")
@@ -1988,11 +2135,15 @@ class AdobeStockScraper:
             import subprocess
             import json
             
+            if self._ffprobe_path is None:
+                self.logger.debug("ffprobe not installed - skipping URL duration probe")
+                return None
+            
             self.logger.info(f"Using ffprobe to get duration for video URL")
             
             # Try to run ffprobe on the URL directly
             cmd = [
-                'ffprobe', 
+                self._ffprobe_path, 
                 '-v', 'quiet',
                 '-print_format', 'json',
                 '-show_format',
@@ -2058,28 +2209,40 @@ class AdobeStockScraper:
         import subprocess
         import json
         
+        # The partial download is only useful to ffprobe, so don't fetch it when ffprobe is missing
+        if self._ffprobe_path is None:
+            return None
+        
         # Create a temporary file for the partial download
         temp_file = None
         try:
             # Download first 2MB to get enough metadata
-            headers = {'Range': 'bytes=0-2097151'}  # First 2MB
+            partial_limit = 2 * 1024 * 1024
+            headers = {'Range': f'bytes=0-{partial_limit - 1}'}  # First 2MB
             response = self.session.get(video_url, headers=headers, timeout=30, stream=True)
             
             if response.status_code in [200, 206]:  # Success or partial content
                 # Create temporary file
+                partial_bytes = 0
                 with tempfile.NamedTemporaryFile(suffix='.mp4', delete=False) as temp_file:
                     temp_filename = temp_file.name
                     
-                    # Write the partial content
-                    for chunk in response.iter_content(chunk_size=8192):
+                    # Write the partial content, counting bytes as they stream (the body is consumed
+                    # here, so response.content is not available afterwards)
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                         if chunk:
                             temp_file.write(chunk)
+                            partial_bytes += len(chunk)
+                            # A server that ignores Range sends the whole video - stop at the limit anyway
+                            if partial_bytes >= partial_limit:
+                                break
+                response.close()
                 
-                self.logger.info(f"Downloaded partial video ({len(response.content) if hasattr(response, 'content') else 'unknown'} bytes) for duration check")
+                self.logger.info(f"Downloaded partial video ({partial_bytes} bytes) for duration check")
                 
                 # Use ffprobe on the temporary file
                 cmd = [
-                    'ffprobe', 
+                    self._ffprobe_path, 
                     '-v', 'quiet',
                     '-print_format', 'json',
                     '-show_format',
@@ -2220,14 +2383,13 @@ class AdobeStockScraper:
             self.logger.debug(f"✅ Video {video_id} duration {current_duration}s - within acceptable range")
         
         # Create filename
+        fallback_filename = None
         if not filename:
             # Extract and clean the Adobe Stock title for use as filename
             adobe_title = video_data.get('title', f'Adobe_Stock_Video_{video_id}')
             
             # Clean the title to make it safe for filesystem
-            safe_title = re.sub(r'[^\w\s-]', '', adobe_title)  # Remove special characters except spaces and hyphens
-            safe_title = re.sub(r'[-\s]+', '_', safe_title)    # Replace spaces and hyphens with underscores
-            safe_title = safe_title.strip('_')                 # Remove leading/trailing underscores
+            safe_title = _clean_name(adobe_title)
             
             # Limit title length to avoid filesystem issues
             if len(safe_title) > 100:
@@ -2242,33 +2404,37 @@ class AdobeStockScraper:
             # Use Adobe Stock title as the primary filename
             filename = f"{safe_title}{extension}"
             
-            # Check if file with this name already exists, if so, append video ID to make it unique
-            base_filepath = self.download_dir / filename
-            if base_filepath.exists():
-                filename = f"{safe_title}_{video_id}{extension}"
+            # If a file with this name already exists, append video ID to make it unique
+            fallback_filename = f"{safe_title}_{video_id}{extension}"
         
-        filepath = self.download_dir / filename
+        # Check if any file with this video ID already exists (different filename)
+        for existing_name in _list_video_filenames(self.download_dir):
+            existing_filename = os.path.splitext(existing_name)[0]
+            # Check if existing file contains this video ID
+            if video_id in existing_filename:
+                print(f"🔄 Skipping {video_id} (exists as {existing_name})")
+                self.existing_video_ids.add(video_id)
+                return True, existing_name
         
-        # Enhanced file existence check - both filename and video ID based
-        if filepath.exists():
+        # Create the file exclusively - this doubles as the existence check and stops two
+        # downloads (threads or scraper processes) from writing the same file at once
+        f = None
+        for candidate in (filename, fallback_filename):
+            if candidate is None:
+                continue
+            filename = candidate
+            filepath = self.download_dir / filename
+            try:
+                f = open(filepath, 'xb')
+                break
+            except FileExistsError:
+                continue
+        
+        if f is None:
             self.logger.debug(f"File {filename} already exists, skipping...")
             # Add to existing video IDs if not already there
             self.existing_video_ids.add(video_id)
             return True, filename
-        
-        # Check if any file with this video ID already exists (different filename)
-        video_extensions = ['*.mp4', '*.mov', '*.webm', '*.avi', '*.mkv']
-        existing_files = []
-        for ext in video_extensions:
-            existing_files.extend(self.download_dir.glob(ext))
-        
-        for existing_file in existing_files:
-            existing_filename = existing_file.stem
-            # Check if existing file contains this video ID
-            if video_id in existing_filename:
-                print(f"🔄 Skipping {video_id} (exists as {existing_file.name})")
-                self.existing_video_ids.add(video_id)
-                return True, existing_file.name
 
         # Show video processing status
         video_title = video_data.get('title', f'Video_{video_id}')
@@ -2277,67 +2443,87 @@ class AdobeStockScraper:
         print(f"📥 Downloading: {video_title}")
 
         try:
-            # Check file size before downloading if max_size_bytes is set
-            if self.max_size_bytes:
-                try:
-                    # Send HEAD request to get Content-Length without downloading
-                    head_response = self.session.head(download_url, timeout=10)
-                    content_length = head_response.headers.get('content-length')
-                    
-                    if content_length:
-                        file_size_bytes = int(content_length)
-                        if file_size_bytes > self.max_size_bytes:
-                            size_mb = file_size_bytes / (1024 * 1024)
-                            max_size_mb = self.max_size_bytes / (1024 * 1024)
-                            print(f"🚫 Skipping {video_id} (size {size_mb:.1f}MB > {max_size_mb:.1f}MB)")
-                            return False, None
-                        else:
-                            size_mb = file_size_bytes / (1024 * 1024)
-                            max_size_mb = self.max_size_bytes / (1024 * 1024)
-                            self.logger.debug(f"✅ Video {video_id} file size {size_mb:.1f}MB - within limit of {max_size_mb:.1f}MB")
-
-                except Exception as e:
-                    self.logger.debug(f"⚠️ Error checking file size for {video_id}: {e} - proceeding with download")
-            
             # Use the session with proper headers for Adobe Stock
             response = self.session.get(download_url, stream=True, timeout=60)
             response.raise_for_status()
             
             # Check if we got a valid video file
             content_type = response.headers.get('content-type', '').lower()
+            if content_type.startswith('text/html'):
+                # An HTML page (login redirect, error page) is never the video - skip it before
+                # downloading the body
+                print(f"❌ Error downloading {video_id}: got an HTML page instead of a video")
+                response.close()
+                f.close()
+                filepath.unlink()
+                return False, None
             if 'video' not in content_type and 'application/octet-stream' not in content_type:
                 self.logger.debug(f"Unexpected content type for {filename}: {content_type}")
                 # Continue anyway as Adobe Stock might return different content types
             
-            # Double-check file size during download if we couldn't check it beforehand
+            # Check file size from the response headers before reading the body. The streamed GET
+            # has only fetched headers at this point, so no separate HEAD round trip is needed
+            check_size_while_streaming = bool(self.max_size_bytes)
             if self.max_size_bytes:
                 content_length = response.headers.get('content-length')
                 if content_length:
                     file_size_bytes = int(content_length)
+                    size_mb = file_size_bytes / (1024 * 1024)
+                    max_size_mb = self.max_size_bytes / (1024 * 1024)
                     if file_size_bytes > self.max_size_bytes:
-                        size_mb = file_size_bytes / (1024 * 1024)
-                        max_size_mb = self.max_size_bytes / (1024 * 1024)
                         print(f"🚫 Skipping {video_id} (size {size_mb:.1f}MB > {max_size_mb:.1f}MB)")
+                        response.close()  # Drop the connection without downloading the body
+                        f.close()
+                        filepath.unlink()
                         return False, None
+                    self.logger.debug(f"✅ Video {video_id} file size {size_mb:.1f}MB - within limit of {max_size_mb:.1f}MB")
+                    
+                    # An uncompressed body is exactly content-length bytes, which is within the limit
+                    if not response.headers.get('content-encoding'):
+                        check_size_while_streaming = False
             
             downloaded_bytes = 0
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded_bytes += len(chunk)
-                        
-                        # Check downloaded size if max_size_bytes is set
-                        if self.max_size_bytes and downloaded_bytes > self.max_size_bytes:
-                            size_mb = downloaded_bytes / (1024 * 1024)
-                            max_size_mb = self.max_size_bytes / (1024 * 1024)
-                            print(f"🚫 Skipping {video_id} (size {size_mb:.1f}MB > {max_size_mb:.1f}MB)")
-                            # Remove the partially downloaded file
-                            filepath.unlink()
-                            return False, None
+            with f:
+                # Reserve the full size up front for larger uncompressed downloads so the filesystem
+                # can allocate contiguous extents instead of growing the file chunk by chunk
+                preallocated_bytes = 0
+                expected_length = response.headers.get('content-length')
+                if (hasattr(os, 'posix_fallocate') and expected_length and expected_length.isdigit()
+                        and not response.headers.get('content-encoding')
+                        and int(expected_length) >= DOWNLOAD_CHUNK_SIZE):
+                    try:
+                        os.posix_fallocate(f.fileno(), 0, int(expected_length))
+                        preallocated_bytes = int(expected_length)
+                    except OSError as e:
+                        self.logger.debug(f"Could not preallocate {filename}: {e}")
+                
+                if not check_size_while_streaming:
+                    # No size limit to enforce mid-stream, so let shutil copy in large C-level blocks
+                    response.raw.decode_content = True
+                    shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+                    downloaded_bytes = f.tell()
+                else:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        if chunk:
+                            f.write(chunk)
+                            downloaded_bytes += len(chunk)
+                            
+                            # Check downloaded size if max_size_bytes is set
+                            if downloaded_bytes > self.max_size_bytes:
+                                size_mb = downloaded_bytes / (1024 * 1024)
+                                max_size_mb = self.max_size_bytes / (1024 * 1024)
+                                print(f"🚫 Skipping {video_id} (size {size_mb:.1f}MB > {max_size_mb:.1f}MB)")
+                                # Remove the partially downloaded file
+                                f.close()
+                                filepath.unlink()
+                                return False, None
+                
+                # Drop any preallocated space the body didn't fill
+                if downloaded_bytes < preallocated_bytes:
+                    f.truncate(downloaded_bytes)
             
             # Check if the downloaded file has a reasonable size
-            file_size = filepath.stat().st_size
+            file_size = downloaded_bytes
             if file_size < 1024:  # Less than 1KB might indicate an error
                 self.logger.warning(f"Downloaded file {filename} is very small ({file_size} bytes) - might be an error page")
                 # Don't delete automatically, let the user decide
@@ -2381,11 +2567,21 @@ class AdobeStockScraper:
             
             return True, filename
             
-        except requests.RequestException as e:
+        except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+            # urllib3 errors surface unwrapped when reading response.raw directly
             print(f"❌ Error downloading {video_id}: {e}")
+            f.close()
             if filepath.exists():
                 filepath.unlink()  # Remove partial file
             return False, None
+        except BaseException:
+            # Any other failure (bad headers, disk errors, Ctrl+C) must not leave the claimed file
+            # behind, or the next run would take the empty or partial file for a finished download
+            f.close()
+            if filepath.exists():
+                filepath.unlink()
+            self.existing_video_ids.discard(video_id)
+            raise
 
     def get_video_duration_from_file(self, filepath) -> Optional[int]:
         """
@@ -2397,12 +2593,16 @@ class AdobeStockScraper:
         Returns:
             Duration in seconds, or None if not available
         """
+        if self._ffprobe_path is None:
+            self.logger.debug(f"ffprobe not installed - cannot check duration of {filepath}")
+            return None
+        
         try:
             import subprocess
             import json
             
             cmd = [
-                'ffprobe', 
+                self._ffprobe_path, 
                 '-v', 'quiet',
                 '-print_format', 'json',
                 '-show_format',
@@ -2447,9 +2647,7 @@ class AdobeStockScraper:
         original_download_dir = self.download_dir
         
         # Create a subdirectory for this query
-        clean_query = re.sub(r'[^\w\s-]', '', query)
-        clean_query = re.sub(r'[-\s]+', '_', clean_query)
-        clean_query = clean_query.lower().strip('_')
+        clean_query = _clean_name(query).lower()
         
         query_dir = self.download_dir / clean_query
         query_dir.mkdir(exist_ok=True)
@@ -2476,22 +2674,12 @@ class AdobeStockScraper:
         # Create metadata files
         metadata_file = query_dir / "query_metadata.json"
         
-        # Load existing video IDs to prevent duplicates
-        existing_video_ids = self.load_existing_video_ids(query_dir)
+        # Load existing video IDs to prevent duplicates, sharing one directory listing with the count
+        existing_filenames = _list_video_filenames(query_dir)
+        existing_video_ids = self.load_existing_video_ids(query_dir, existing_filenames)
         
-        # Count existing video files (exclude metadata files)
-        video_extensions = ['.mp4', '.mov', '.webm', '.avi', '.mkv']
-        
-        # Filter out metadata files
-        existing_files = list(query_dir.glob("*.mp4")) + \
-                        list(query_dir.glob("*.mov")) + \
-                        list(query_dir.glob("*.webm")) + \
-                        list(query_dir.glob("*.avi")) + \
-                        list(query_dir.glob("*.mkv"))
-        
-        # Filter out metadata files
-        existing_files = [f for f in existing_files if f.name != "query_metadata.json"]
-        existing_count = len(existing_files)
+        # Count existing video files (metadata files never have a video extension)
+        existing_count = len(existing_filenames)
         
         if existing_count > 0:
             print(f"Found {existing_count} existing videos")
@@ -2500,8 +2688,8 @@ class AdobeStockScraper:
         existing_video_mappings = {}
         if metadata_file.exists():
             try:
-                with open(metadata_file, 'r', encoding='utf-8') as f:
-                    existing_metadata = json.load(f)
+                with open(metadata_file, 'rb') as f:
+                    existing_metadata = _json_loads(f.read())
                     existing_video_mappings = existing_metadata.get("video_file_mappings", {})
                     metadata["created_at"] = existing_metadata.get("created_at", metadata["created_at"])
             except (json.JSONDecodeError, KeyError):
@@ -2514,14 +2702,10 @@ class AdobeStockScraper:
         if needed_count <= 0:
             print(f"Already have {existing_count} videos, no additional downloads needed")
             
-            # Still update metadata file
-            with open(query_dir / "query_metadata.js", 'w', encoding='utf-8') as f:
-                f.write(f'const {clean_query}_metadata = ')
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
-                f.write(';')
-            
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            # Still update metadata file (written atomically so a crash can't leave half-written JSON)
+            metadata_json = _json_dumps(metadata)
+            _write_text_atomic(query_dir / "query_metadata.js", f'const {clean_query}_metadata = {metadata_json};')
+            _write_text_atomic(metadata_file, metadata_json)
             
             return existing_count
         
@@ -2618,30 +2802,37 @@ class AdobeStockScraper:
                 if search_attempts == 1:
                     print(f"Found {len(candidate_videos)} videos to process...")
                 
-                # Try to download the candidate videos
+                # Try to download the candidate videos, up to max_workers at a time. Only as many
+                # downloads as are still needed are in flight, so the target count is never overshot
                 attempt_downloads = 0
-                for i, video in enumerate(candidate_videos):
-                    if successful_downloads >= needed_count:
-                        break
-                    
-                    total_videos_processed += 1
-                    
-                    # Try to download the video
-                    success, filename = self.download_video(video)
-                    if success:
-                        successful_downloads += 1
-                        attempt_downloads += 1
-                        # Store the mapping between video ID and filename
-                        video_filename_mapping[video['id']] = {
-                            'filename': filename,
-                            'title': video['title'],
-                            'url': video.get('comp_url') or video.get('preview_url') or f'https://stock.adobe.com/Download/Watermarked/{video["id"]}',
-                            'download_timestamp': time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
-                            'search_attempt': search_attempts
-                        }
-                    
-                    # Rate limiting between downloads
-                    time.sleep(self.delay)
+                pending_candidates = deque(candidate_videos)
+                in_flight = {}  # future -> video
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    while pending_candidates or in_flight:
+                        while (pending_candidates and len(in_flight) < self.max_workers
+                               and successful_downloads + len(in_flight) < needed_count):
+                            video = pending_candidates.popleft()
+                            total_videos_processed += 1
+                            in_flight[executor.submit(self._rate_limited_download, video)] = video
+                        
+                        if not in_flight:
+                            break
+                        
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            video = in_flight.pop(future)
+                            success, filename = future.result()
+                            if success:
+                                successful_downloads += 1
+                                attempt_downloads += 1
+                                # Store the mapping between video ID and filename
+                                video_filename_mapping[video['id']] = {
+                                    'filename': filename,
+                                    'title': video['title'],
+                                    'url': video.get('comp_url') or video.get('preview_url') or f'https://stock.adobe.com/Download/Watermarked/{video["id"]}',
+                                    'download_timestamp': time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
+                                    'search_attempt': search_attempts
+                                }
                 
                 # If we got no successful downloads from this batch, increase the search multiplier
                 if attempt_downloads == 0:
@@ -2669,9 +2860,14 @@ class AdobeStockScraper:
                 if self.max_duration_seconds or self.min_duration_seconds:
                     print(f"Consider adjusting duration filters (currently {self.min_duration_seconds}-{self.max_duration_seconds}s)")
             
+            # Nothing new to record if this session downloaded no videos and metadata already exists
+            if successful_downloads == 0 and metadata_file.exists():
+                return total_files
+            
             # Update metadata with download completion info and video mappings
             try:
-                metadata["last_updated"] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+                now = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+                metadata["last_updated"] = now
                 metadata["total_videos_downloaded"] = total_files
                 metadata["last_download_session"] = {
                     "requested_count": count,
@@ -2682,7 +2878,7 @@ class AdobeStockScraper:
                     "existing_videos_at_start": len(existing_video_ids),
                     "ignore_list_size": ignore_list_size,
                     "max_search_attempts_reached": search_attempts >= max_search_attempts,
-                    "session_timestamp": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+                    "session_timestamp": now
                 }
                 
                 # Add or update video ID to filename mappings
@@ -2693,8 +2889,7 @@ class AdobeStockScraper:
                 metadata["video_file_mappings"] = existing_video_mappings.copy()
                 metadata["video_file_mappings"].update(video_filename_mapping)
                 
-                with open(metadata_file, 'w', encoding='utf-8') as f:
-                    json.dump(metadata, f, indent=2, ensure_ascii=False)
+                _write_text_atomic(metadata_file, _json_dumps(metadata))
                 
                 self.logger.debug(f"Updated metadata with {len(video_filename_mapping)} new video file mappings")
             except Exception as e:
@@ -2706,6 +2901,27 @@ class AdobeStockScraper:
             # Restore original download directory
             self.download_dir = original_download_dir
 
+    def _rate_limited_download(self, video_data: Dict) -> Tuple[bool, Optional[str]]:
+        """
+        Download a video once the shared rate limit allows another download to start.
+        Download starts are spaced at least self.delay seconds apart across all worker threads.
+        
+        Args:
+            video_data: Video data dictionary
+            
+        Returns:
+            Tuple of (success: bool, filename: str) from download_video
+        """
+        with self._download_rate_lock:
+            now = time.monotonic()
+            wait_seconds = self._next_download_at - now
+            self._next_download_at = max(now, self._next_download_at) + self.delay
+        
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+        
+        return self.download_video(video_data)
+
     def _handle_json_output_mode(self, query: str, count: int, search_count: int) -> int:
         """
         Handle JSON output mode - search for videos and create JSON instead of downloading.
@@ -2723,9 +2939,7 @@ class AdobeStockScraper:
         try:
             # Enhanced duplicate checking for JSON mode
             # Create a temporary directory to check for existing JSON output duplicates
-            clean_query = re.sub(r'[^\w\s-]', '', query)
-            clean_query = re.sub(r'[-\s]+', '_', clean_query)
-            clean_query = clean_query.lower().strip('_')
+            clean_query = _clean_name(query).lower()
             
             # Check for existing JSON files that might contain duplicates
             existing_json_files = list(self.download_dir.glob(f"{clean_query}*.json"))
@@ -2972,9 +3186,7 @@ class AdobeStockScraper:
             Path to saved JSON file
         """
         # Create a clean filename from the query
-        clean_query = re.sub(r'[^\w\s-]', '', query)  # Remove special characters
-        clean_query = re.sub(r'[-\s]+', '_', clean_query)  # Replace spaces/hyphens with underscores
-        clean_query = clean_query.lower().strip('_')  # Lowercase and remove leading/trailing underscores
+        clean_query = _clean_name(query).lower()
         
         # Create filename with timestamp to avoid conflicts
         timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime())
@@ -3055,6 +3267,7 @@ def main():
     parser.add_argument('--intended-label', type=str, help='Label for JSON output structure (required when using --json-output)')
     parser.add_argument('--sample-from', type=int, help='Search for this many videos and randomly sample the requested count from them. Must be greater than --count. Useful for getting diverse/random results instead of just the first N videos found.')
     parser.add_argument('--no-ignore-list', action='store_true', help='Disable ignore list functionality - do not skip videos from the ignore_list directory')
+    parser.add_argument('--workers', '-w', type=int, default=4, help='Number of concurrent search page fetches and video downloads (default: 4)')
     
     args = parser.parse_args()
     
@@ -3107,14 +3320,13 @@ def main():
         sample_from=args.sample_from,
         query=args.query,  # Pass query to enable query-specific ignore lists
         random_mode=args.random,
-        use_ignore_list=use_ignore_list
+        use_ignore_list=use_ignore_list,
+        max_workers=args.workers
     )
     
     # Create clean query name for the subdirectory (only for specific queries)
     if args.query:
-        clean_query = re.sub(r'[^\w\s-]', '', args.query)
-        clean_query = re.sub(r'[-\s]+', '_', clean_query)
-        clean_query = clean_query.lower().strip('_')
+        clean_query = _clean_name(args.query).lower()
     else:
         clean_query = "random_videos"
     
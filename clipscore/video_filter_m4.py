@@ -5,12 +5,15 @@ Simplified version that avoids problematic imports.
 """
 
 import argparse
+import heapq
 import json
 import os
 import shutil
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 import numpy as np
 
 # Import required libraries
@@ -19,12 +22,41 @@ try:
     import clip
     from PIL import Image
     import cv2
-    from sklearn.metrics.pairwise import cosine_similarity
 except ImportError as e:
     print(f"Error: Missing required dependencies: {e}")
-    print("Run: pip install torch clip-by-openai pillow opencv-python-headless scikit-learn")
+    print("Run: pip install torch clip-by-openai pillow opencv-python-headless")
     sys.exit(1)
 
+# Optional faster JSON parser (falls back to the standard library)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_loads(data):
+    """Parse JSON from a str or bytes object, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Largest gap between sampled frames that is decoded through instead of seeked over
+MAX_SEQUENTIAL_SKIP = 48
+
+# Short-side length CLIP's ViT-B/32 preprocessing resizes frames to before its center crop
+CLIP_INPUT_SIZE = 224
+
+# Number of videos whose frames are decoded ahead of the one being encoded
+FRAME_PREFETCH = 4
+
+# Per-directory cache of video embeddings, which don't depend on the query. Bump the preprocessing
+# version whenever frame extraction or preprocessing changes, so older embeddings are recomputed
+EMBEDDING_PREPROCESS_VERSION = 2
+EMBEDDING_CACHE_FILE = f"clip_vit_b32_v{EMBEDDING_PREPROCESS_VERSION}_embeddings.npz"
+
+# Number of filtered videos copied to the output directory at once
+COPY_WORKERS = 4
+
 
 class M4VideoFilter:
     def __init__(self, device=None):
@@ -48,10 +80,14 @@ class M4VideoFilter:
         else:
             print("💻 Using CPU (slower processing)")
         
+        # Text embeddings by query, so subdirectories sharing a query only encode it once
+        self._text_cache: Dict[str, np.ndarray] = {}
+        
         # Load CLIP model
         try:
             print("Loading CLIP model...")
             self.model, self.preprocess = clip.load("ViT-B/32", device=self.device)
+            self.model.eval()
             print("✅ CLIP model loaded successfully")
         except Exception as e:
             print(f"❌ Error loading CLIP model: {e}")
@@ -75,14 +111,42 @@ class M4VideoFilter:
         frame_indices = np.linspace(0, total_frames - 1, num_frames, dtype=int)
         frames = []
         
+        # Every seek re-decodes from the nearest keyframe, so step forward with grab() between
+        # nearby samples and only seek across gaps longer than MAX_SEQUENTIAL_SKIP frames
+        position = 0  # Index of the frame the next read() returns
+        last_idx, last_frame = None, None
         for frame_idx in frame_indices:
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+            if frame_idx == last_idx:
+                # Short videos repeat indices; reuse the frame already decoded
+                if last_frame is not None:
+                    frames.append(last_frame)
+                continue
+            
+            if frame_idx - position > MAX_SEQUENTIAL_SKIP:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+            else:
+                for _ in range(frame_idx - position):
+                    cap.grab()
+            position = frame_idx + 1
+            last_idx, last_frame = frame_idx, None
+            
             ret, frame = cap.read()
             
             if ret:
+                # Downscale to CLIP's short side here with one area resample, so the held frames are
+                # small and preprocess is left with little more than the center crop and normalization
+                height, width = frame.shape[:2]
+                if min(height, width) > CLIP_INPUT_SIZE:
+                    if width <= height:
+                        size = (CLIP_INPUT_SIZE, int(CLIP_INPUT_SIZE * height / width))
+                    else:
+                        size = (int(CLIP_INPUT_SIZE * width / height), CLIP_INPUT_SIZE)
+                    frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+                
                 # Convert BGR to RGB
                 frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
                 frames.append(frame_rgb)
+                last_frame = frame_rgb
         
         cap.release()
         print(f"  ✅ Extracted {len(frames)} frames")
@@ -90,61 +154,75 @@ class M4VideoFilter:
     
     def encode_video(self, video_path: Path) -> np.ndarray:
         """Encode a video into a CLIP embedding by averaging frame embeddings."""
+        return self.encode_frame_batch(self.load_frame_batch(video_path))
+    
+    def load_frame_batch(self, video_path: Path) -> Optional[torch.Tensor]:
+        """Extract frames from a video and preprocess them into one CPU batch tensor for CLIP."""
         frames = self.extract_frames(video_path)
         
         if not frames:
+            return None
+        
+        # CLIP's own PIL transform, run here so prefetch threads do it off the encoding thread
+        processed = [self.preprocess(Image.fromarray(frame)) for frame in frames]
+        
+        if self.device == "cuda":
+            # Stack straight into page-locked memory so the upload is one asynchronous copy
+            frame_batch = torch.empty((len(processed), *processed[0].shape), dtype=processed[0].dtype, pin_memory=True)
+            return torch.stack(processed, out=frame_batch)
+        
+        return torch.stack(processed)
+    
+    def encode_frame_batch(self, frame_batch: Optional[torch.Tensor]) -> np.ndarray:
+        """Encode a preprocessed frame batch into a single normalized CLIP embedding."""
+        if frame_batch is None:
             return np.zeros(512)  # Return zero embedding for failed videos
         
-        frame_embeddings = []
+        print(f"  🧠 Processing {frame_batch.shape[0]} frames with CLIP...")
+        # Encode every frame in a single batched forward pass
+        image_input = frame_batch.to(self.device, non_blocking=True)
         
-        print(f"  🧠 Processing {len(frames)} frames with CLIP...")
-        for i, frame in enumerate(frames):
-            # Convert numpy array to PIL Image
-            pil_image = Image.fromarray(frame)
-            
-            # Preprocess and encode the frame
-            image_input = self.preprocess(pil_image).unsqueeze(0).to(self.device)
-            
-            with torch.no_grad():
-                image_features = self.model.encode_image(image_input)
-                image_features = image_features / image_features.norm(dim=-1, keepdim=True)
-                frame_embeddings.append(image_features.cpu().numpy())
-        
-        if frame_embeddings:
-            # Average all frame embeddings
-            video_embedding = np.mean(frame_embeddings, axis=0)
-            print(f"  ✅ Video encoded successfully")
-            return video_embedding.flatten()
-        else:
-            return np.zeros(512)
+        with torch.inference_mode():
+            image_features = self.model.encode_image(image_input)
+            image_features = image_features / image_features.norm(dim=-1, keepdim=True)
+            # Average all frame embeddings, then renormalize so similarity is a plain dot product
+            video_embedding = image_features.mean(dim=0)
+            video_embedding = video_embedding / video_embedding.norm()
+        
+        print(f"  ✅ Video encoded successfully")
+        # clip.load keeps the weights in FP16 on GPU devices; hand back FP32 for the similarity math
+        return video_embedding.float().cpu().numpy()
     
     def encode_text(self, text: str) -> np.ndarray:
-        """Encode text into a CLIP embedding."""
+        """Encode text into a CLIP embedding, reusing the cached embedding for repeated text."""
+        if text in self._text_cache:
+            return self._text_cache[text]
+        
         text_input = clip.tokenize([text]).to(self.device)
         
-        with torch.no_grad():
+        with torch.inference_mode():
             text_features = self.model.encode_text(text_input)
             text_features = text_features / text_features.norm(dim=-1, keepdim=True)
-            return text_features.cpu().numpy().flatten()
+            text_embedding = text_features.float().cpu().numpy().flatten()
+        
+        self._text_cache[text] = text_embedding
+        return text_embedding
     
     def calculate_similarity(self, video_embedding: np.ndarray, text_embedding: np.ndarray) -> float:
         """Calculate cosine similarity between video and text embeddings."""
         if video_embedding.shape[0] == 0 or text_embedding.shape[0] == 0:
             return 0.0
         
-        video_embedding = video_embedding.reshape(1, -1)
-        text_embedding = text_embedding.reshape(1, -1)
-        
-        similarity = cosine_similarity(video_embedding, text_embedding)[0][0]
-        return float(similarity)
+        # Both embeddings are already L2-normalized (or all zeros for failed videos), so the cosine is their dot product
+        return float(np.dot(video_embedding, text_embedding))
     
     def find_videos(self, directory: Path) -> List[Path]:
         """Find all video files in a directory."""
-        video_extensions = {'.mp4', '.mov', '.webm', '.avi', '.mkv'}
-        video_files = []
+        video_extensions = ('.mp4', '.mov', '.webm', '.avi', '.mkv')
         
-        for ext in video_extensions:
-            video_files.extend(directory.glob(f"*{ext}"))
+        # One directory scan instead of a glob per extension
+        with os.scandir(directory) as entries:
+            video_files = [Path(entry.path) for entry in entries if entry.name.endswith(video_extensions)]
         
         return sorted(video_files)
     
@@ -156,31 +234,71 @@ class M4VideoFilter:
             return {}
         
         try:
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(metadata_file, 'rb') as f:
+                return _json_loads(f.read())
         except Exception as e:
             print(f"⚠️  Warning: Could not load metadata from {metadata_file}: {e}")
             return {}
     
+    def load_embedding_cache(self, directory: Path) -> Dict[str, Tuple[Tuple[int, int], np.ndarray]]:
+        """Load cached video embeddings for a directory, keyed by filename with (mtime_ns, size)."""
+        cache_file = directory / EMBEDDING_CACHE_FILE
+        
+        if not cache_file.exists():
+            return {}
+        
+        try:
+            with np.load(cache_file, allow_pickle=False) as data:
+                return {
+                    str(name): ((int(mtime_ns), int(size)), embedding)
+                    for name, (mtime_ns, size), embedding in zip(data["names"], data["file_keys"], data["embeddings"])
+                }
+        except Exception as e:
+            print(f"⚠️  Warning: Could not load embedding cache from {cache_file}: {e}")
+            return {}
+    
+    def save_embedding_cache(self, directory: Path, cache: Dict[str, Tuple[Tuple[int, int], np.ndarray]]):
+        """Save video embeddings for a directory, replacing the cache file atomically."""
+        cache_file = directory / EMBEDDING_CACHE_FILE
+        tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+        names = sorted(cache)
+        
+        try:
+            with open(tmp_file, 'wb') as f:
+                np.savez(
+                    f,
+                    names=np.array(names, dtype=str),
+                    file_keys=np.array([cache[name][0] for name in names], dtype=np.int64).reshape(-1, 2),
+                    embeddings=np.array([cache[name][1] for name in names], dtype=np.float32).reshape(-1, 512)
+                )
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            print(f"⚠️  Warning: Could not save embedding cache to {cache_file}: {e}")
+    
     def filter_videos(self, source_dir: Path, query: str = None, top_k: int = 5) -> List[Tuple[Path, float, str]]:
         """Filter videos by similarity to query text."""
         print(f"\n🔍 Filtering videos in: {source_dir}")
         
         video_results = []
         
-        # Process each subdirectory
-        for subdir in source_dir.iterdir():
-            if not subdir.is_dir():
-                continue
-            
+        # Process each subdirectory; DirEntry.is_dir() answers from the directory listing, without a stat per entry
+        with os.scandir(source_dir) as entries:
+            subdirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+        
+        for subdir in subdirs:
             print(f"\n📁 Processing directory: {subdir.name}")
             
-            # Load metadata to get the original query
-            metadata = self.load_metadata(subdir)
+            # Find video files first, so directories without any never have their metadata read
+            video_files = self.find_videos(subdir)
             
-            # Use provided query or fall back to metadata query
+            if not video_files:
+                print(f"⚠️  No video files found in {subdir.name}")
+                continue
+            
+            # Use provided query, only reading the metadata to fall back to its query
             search_query = query
-            if not search_query and metadata:
+            if not search_query:
+                metadata = self.load_metadata(subdir)
                 search_query = metadata.get('original_query', metadata.get('clean_query', ''))
             
             if not search_query:
@@ -193,33 +311,56 @@ class M4VideoFilter:
             text_embedding = self.encode_text(search_query)
             print(f"✅ Text query encoded")
             
-            # Find video files
-            video_files = self.find_videos(subdir)
-            
-            if not video_files:
-                print(f"⚠️  No video files found in {subdir.name}")
-                continue
-            
             print(f"🎥 Found {len(video_files)} video files")
             
-            # Process each video
+            # Reuse embeddings from earlier runs for videos that haven't changed since
+            cached_embeddings = self.load_embedding_cache(subdir)
+            embedding_cache = {}
+            video_embeddings = {}
+            videos_to_encode = []
             for video_file in video_files:
-                print(f"\n📹 Processing: {video_file.name}")
-                
-                # Encode video
-                video_embedding = self.encode_video(video_file)
-                
-                # Calculate similarity
-                similarity = self.calculate_similarity(video_embedding, text_embedding)
-                
-                video_results.append((video_file, similarity, search_query))
-                print(f"📊 Similarity score: {similarity:.4f}")
-        
-        # Sort by similarity (highest first)
-        video_results.sort(key=lambda x: x[1], reverse=True)
+                stat = video_file.stat()
+                file_key = (stat.st_mtime_ns, stat.st_size)
+                cached = cached_embeddings.get(video_file.name)
+                if cached is not None and cached[0] == file_key:
+                    embedding_cache[video_file.name] = cached
+                    video_embeddings[video_file.name] = cached[1]
+                else:
+                    videos_to_encode.append((video_file, file_key))
+            
+            if video_embeddings:
+                print(f"♻️  Reusing cached embeddings for {len(video_embeddings)} videos")
+            
+            # Decode and preprocess frames for the next videos on worker threads (OpenCV and PIL release
+            # the GIL) while CLIP encodes the current one; at most FRAME_PREFETCH batches are held at once
+            with ThreadPoolExecutor(max_workers=FRAME_PREFETCH) as executor:
+                pending_frames = deque()
+                next_to_decode = 0
+                for video_file, file_key in videos_to_encode:
+                    while next_to_decode < len(videos_to_encode) and len(pending_frames) < FRAME_PREFETCH:
+                        pending_frames.append(executor.submit(self.load_frame_batch, videos_to_encode[next_to_decode][0]))
+                        next_to_decode += 1
+                    
+                    print(f"\n📹 Processing: {video_file.name}")
+                    video_embedding = self.encode_frame_batch(pending_frames.popleft().result())
+                    video_embeddings[video_file.name] = video_embedding
+                    # Videos that failed to decode are retried next run instead of cached
+                    if video_embedding.any():
+                        embedding_cache[video_file.name] = (file_key, video_embedding)
+            
+            # Rewrite the cache when anything was encoded or removed, keeping only current files
+            if videos_to_encode or len(embedding_cache) != len(cached_embeddings):
+                self.save_embedding_cache(subdir, embedding_cache)
+            
+            # Score every video in the directory against the query with one matrix-vector product
+            similarities = np.stack([video_embeddings[video_file.name] for video_file in video_files]) @ text_embedding
+            print()
+            for video_file, similarity in zip(video_files, similarities):
+                video_results.append((video_file, float(similarity), search_query))
+                print(f"📊 {video_file.name}: similarity score {similarity:.4f}")
         
-        # Return top_k results
-        return video_results[:top_k]
+        # Return the top_k results by similarity (highest first) without sorting every video
+        return heapq.nlargest(top_k, video_results, key=lambda x: x[1])
     
     def clean_query_for_folder(self, query: str) -> str:
         """Clean query text to make it safe for folder names."""
@@ -259,66 +400,76 @@ class M4VideoFilter:
             "query_summary": []
         }
         
-        # Process each query group
-        for query, videos in query_groups.items():
-            # Create query-specific subdirectory
-            query_folder_name = self.clean_query_for_folder(query)
-            query_output_dir = output_dir / query_folder_name
-            query_output_dir.mkdir(parents=True, exist_ok=True)
-            
-            print(f"\n📁 Creating folder for query: '{query}' -> {query_folder_name}")
-            
-            # Create query-specific results data
-            query_results = {
-                "filtering_timestamp": str(Path().absolute()),
-                "original_query": query,
-                "folder_name": query_folder_name,
-                "device_used": self.device,
-                "total_videos_in_query": len(videos),
-                "videos": []
-            }
-            
-            # Sort videos in this query group by similarity
-            videos.sort(key=lambda x: x[1], reverse=True)
-            
-            for i, (video_path, similarity) in enumerate(videos, 1):
-                # Create new filename with rank and similarity
-                original_name = video_path.stem
-                extension = video_path.suffix
-                new_name = f"rank_{i:02d}_sim_{similarity:.4f}_{original_name}{extension}"
+        # Copy every group's files concurrently (shutil.copy2 already uses the OS's in-kernel copy),
+        # then report and record each group's results in rank order
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+            group_jobs = []
+            for query, videos in query_groups.items():
+                # Create query-specific subdirectory
+                query_folder_name = self.clean_query_for_folder(query)
+                query_output_dir = output_dir / query_folder_name
+                query_output_dir.mkdir(parents=True, exist_ok=True)
                 
-                output_path = query_output_dir / new_name
+                # Sort videos in this query group by similarity
+                videos.sort(key=lambda x: x[1], reverse=True)
                 
-                try:
-                    shutil.copy2(video_path, output_path)
-                    print(f"  ✅ Copied: {new_name}")
+                copy_jobs = []
+                for i, (video_path, similarity) in enumerate(videos, 1):
+                    # Create new filename with rank and similarity
+                    original_name = video_path.stem
+                    extension = video_path.suffix
+                    new_name = f"rank_{i:02d}_sim_{similarity:.4f}_{original_name}{extension}"
                     
-                    query_results["videos"].append({
-                        "rank": i,
-                        "original_path": str(video_path),
-                        "output_filename": new_name,
-                        "similarity_score": similarity,
-                        "source_directory": video_path.parent.name
-                    })
-                    
-                except Exception as e:
-                    print(f"  ❌ Failed to copy {video_path.name}: {e}")
-            
-            # Save query-specific results file in the query folder
-            query_results_file = query_output_dir / "filtering_results.json"
-            with open(query_results_file, 'w', encoding='utf-8') as f:
-                json.dump(query_results, f, indent=2, ensure_ascii=False)
-            
-            print(f"  📊 Query results saved to: {query_results_file}")
+                    output_path = query_output_dir / new_name
+                    copy_jobs.append((i, video_path, similarity, new_name, executor.submit(shutil.copy2, video_path, output_path)))
+                
+                group_jobs.append((query, videos, query_folder_name, query_output_dir, copy_jobs))
             
-            # Add to summary
-            summary_data["query_summary"].append({
-                "query": query,
-                "folder_name": query_folder_name,
-                "video_count": len(videos),
-                "top_similarity": max(similarity for _, similarity in videos) if videos else 0.0,
-                "avg_similarity": sum(similarity for _, similarity in videos) / len(videos) if videos else 0.0
-            })
+            # Process each query group
+            for query, videos, query_folder_name, query_output_dir, copy_jobs in group_jobs:
+                print(f"\n📁 Creating folder for query: '{query}' -> {query_folder_name}")
+                
+                # Create query-specific results data
+                query_results = {
+                    "filtering_timestamp": str(Path().absolute()),
+                    "original_query": query,
+                    "folder_name": query_folder_name,
+                    "device_used": self.device,
+                    "total_videos_in_query": len(videos),
+                    "videos": []
+                }
+                
+                for i, video_path, similarity, new_name, copy_future in copy_jobs:
+                    try:
+                        copy_future.result()
+                        print(f"  ✅ Copied: {new_name}")
+                        
+                        query_results["videos"].append({
+                            "rank": i,
+                            "original_path": str(video_path),
+                            "output_filename": new_name,
+                            "similarity_score": similarity,
+                            "source_directory": video_path.parent.name
+                        })
+                        
+                    except Exception as e:
+                        print(f"  ❌ Failed to copy {video_path.name}: {e}")
+                
+                # Save query-specific results file in the query folder
+                query_results_file = query_output_dir / "filtering_results.json"
+                with open(query_results_file, 'w', encoding='utf-8') as f:
+                    json.dump(query_results, f, indent=2, ensure_ascii=False)
+                
+                print(f"  📊 Query results saved to: {query_results_file}")
+                
+                # Add to summary
+                summary_data["query_summary"].append({
+                    "query": query,
+                    "folder_name": query_folder_name,
+                    "video_count": len(videos),
+                    "top_similarity": max(similarity for _, similarity in videos) if videos else 0.0,
+                    "avg_similarity": sum(similarity for _, similarity in videos) / len(videos) if videos else 0.0
+                })
         
         # Save summary results file in the main filtered directory
         summary_file = output_dir / "filtering_summary.json"
@@ -9,81 +9,103 @@ Usage:
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def read_metadata(directory_path):
-    """Read and display metadata from a scraper download directory."""
+# Optional faster JSON parser (falls back to the standard library)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_loads(data):
+    """Parse JSON from a str or bytes object, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def format_metadata(directory_path):
+    """Read metadata from a scraper download directory and format it for display.
+    
+    Returns a (success, report) tuple so directories can be read in parallel
+    and printed in order afterwards.
+    """
+    lines = []
     dir_path = Path(directory_path)
     
     if not dir_path.exists():
-        print(f"Error: Directory '{directory_path}' does not exist.")
-        return False
+        lines.append(f"Error: Directory '{directory_path}' does not exist.")
+        return False, "\n".join(lines)
     
     metadata_file = dir_path / "query_metadata.json"
     
     if not metadata_file.exists():
-        print(f"Error: No metadata file found in '{directory_path}'.")
-        return False
+        lines.append(f"Error: No metadata file found in '{directory_path}'.")
+        return False, "\n".join(lines)
     
     try:
-        with open(metadata_file, 'r', encoding='utf-8') as f:
-            metadata = json.load(f)
+        metadata = _json_loads(metadata_file.read_bytes())
         
-        print(f"📁 Directory: {dir_path.name}")
-        print(f"🔍 Original Query: '{metadata.get('original_query', 'N/A')}'")
-        print(f"📂 Clean Query: {metadata.get('clean_query', 'N/A')}")
-        print(f"📅 Created: {metadata.get('created_at', 'N/A')}")
-        print(f"🕒 Last Updated: {metadata.get('last_updated', 'N/A')}")
-        print(f"🎥 Total Videos Downloaded: {metadata.get('total_videos_downloaded', 0)}")
+        lines.append(f"📁 Directory: {dir_path.name}")
+        lines.append(f"🔍 Original Query: '{metadata.get('original_query', 'N/A')}'")
+        lines.append(f"📂 Clean Query: {metadata.get('clean_query', 'N/A')}")
+        lines.append(f"📅 Created: {metadata.get('created_at', 'N/A')}")
+        lines.append(f"🕒 Last Updated: {metadata.get('last_updated', 'N/A')}")
+        lines.append(f"🎥 Total Videos Downloaded: {metadata.get('total_videos_downloaded', 0)}")
         
         if 'last_download_session' in metadata:
             session = metadata['last_download_session']
-            print(f"📊 Last Session:")
-            print(f"   - Requested: {session.get('requested_count', 'N/A')}")
-            print(f"   - New Downloads: {session.get('new_downloads', 'N/A')}")
-            print(f"   - Session Time: {session.get('session_timestamp', 'N/A')}")
+            lines.append(f"📊 Last Session:")
+            lines.append(f"   - Requested: {session.get('requested_count', 'N/A')}")
+            lines.append(f"   - New Downloads: {session.get('new_downloads', 'N/A')}")
+            lines.append(f"   - Session Time: {session.get('session_timestamp', 'N/A')}")
         
         # Display video file mappings if available
         if 'video_file_mappings' in metadata:
             video_mappings = metadata['video_file_mappings']
-            print(f"🔗 Video ID to Filename Mappings ({len(video_mappings)} videos):")
+            lines.append(f"🔗 Video ID to Filename Mappings ({len(video_mappings)} videos):")
             for video_id, mapping in video_mappings.items():
                 filename = mapping.get('filename', 'N/A')
                 title = mapping.get('title', 'N/A')
                 download_time = mapping.get('download_timestamp', 'N/A')
-                print(f"   📹 ID: {video_id}")
-                print(f"      File: {filename}")
-                print(f"      Title: {title[:80]}{'...' if len(title) > 80 else ''}")
-                print(f"      Downloaded: {download_time}")
-                print()
+                lines.append(f"   📹 ID: {video_id}")
+                lines.append(f"      File: {filename}")
+                lines.append(f"      Title: {title[:80]}{'...' if len(title) > 80 else ''}")
+                lines.append(f"      Downloaded: {download_time}")
+                lines.append("")
         
-        # Count actual video files
-        video_extensions = ['.mp4', '.mov', '.webm']
-        video_files = []
-        for ext in video_extensions:
-            video_files.extend(dir_path.glob(f"*{ext}"))
+        # Count actual video files in a single directory scan
+        video_extensions = ('.mp4', '.mov', '.webm')
+        with os.scandir(dir_path) as entries:
+            actual_files = {entry.name for entry in entries if entry.name.endswith(video_extensions)}
         
-        print(f"📹 Actual Video Files Found: {len(video_files)}")
+        lines.append(f"📹 Actual Video Files Found: {len(actual_files)}")
         
         # Check for unmapped files (files that exist but aren't in the mapping)
         if 'video_file_mappings' in metadata:
             mapped_files = {mapping['filename'] for mapping in metadata['video_file_mappings'].values()}
-            actual_files = {f.name for f in video_files}
             unmapped_files = actual_files - mapped_files
             
             if unmapped_files:
-                print(f"⚠️  Unmapped Files ({len(unmapped_files)} files without video ID mapping):")
+                lines.append(f"⚠️  Unmapped Files ({len(unmapped_files)} files without video ID mapping):")
                 for filename in sorted(unmapped_files):
-                    print(f"   - {filename}")
+                    lines.append(f"   - {filename}")
         
-        return True
+        return True, "\n".join(lines)
         
     except json.JSONDecodeError:
-        print(f"Error: Invalid JSON in metadata file '{metadata_file}'.")
-        return False
+        lines.append(f"Error: Invalid JSON in metadata file '{metadata_file}'.")
+        return False, "\n".join(lines)
     except Exception as e:
-        print(f"Error reading metadata: {e}")
-        return False
+        lines.append(f"Error reading metadata: {e}")
+        return False, "\n".join(lines)
+
+def read_metadata(directory_path):
+    """Read and display metadata from a scraper download directory."""
+    success, report = format_metadata(directory_path)
+    print(report)
+    return success
 
 def list_all_downloads(downloads_dir="downloads"):
     """List all download directories and their metadata."""
@@ -105,11 +127,16 @@ def list_all_downloads(downloads_dir="downloads"):
     
     print(f"Found {len(metadata_dirs)} download directories:\n")
     
-    for i, dir_path in enumerate(sorted(metadata_dirs), 1):
-        print(f"{i}. {dir_path.name}")
-        print("   " + "="*50)
-        read_metadata(dir_path)
-        print()
+    # Reading each metadata file is I/O bound, so read them in parallel and print in order
+    metadata_dirs.sort()
+    with ThreadPoolExecutor(max_workers=min(16, len(metadata_dirs))) as executor:
+        reports = executor.map(format_metadata, metadata_dirs)
+        
+        for i, (dir_path, (_, report)) in enumerate(zip(metadata_dirs, reports), 1):
+            print(f"{i}. {dir_path.name}")
+            print("   " + "="*50)
+            print(report)
+            print()
 
 def main():
     if len(sys.argv) > 1:
@@ -18,18 +18,49 @@ import sys
 import re
 from pathlib import Path
 
+# Optional faster JSON parser (falls back to the standard library)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_loads(data):
+    """Parse JSON from a str or bytes object, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj) -> str:
+    """Serialize an object to an indented, non-ASCII-escaped JSON string, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        # Video IDs read from JSON files may be ints; stringify them as the json module does
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+def _write_text_atomic(path: Path, text: str):
+    """Write text to a temporary file next to path, then swap it into place with os.replace."""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+# Look for patterns like _123456789.mp4 or 123456789_ in filename, tried in order
+_FILENAME_ID_PATTERNS = (
+    re.compile(r'_(\d{8,})\.mp4$'),  # Filename ending with _ID.mp4
+    re.compile(r'_(\d{8,})_'),       # ID surrounded by underscores
+    re.compile(r'(\d{8,})\.mp4$'),   # Filename ending with just ID.mp4
+    re.compile(r'^(\d{8,})_'),       # Filename starting with ID_
+)
+
+# Cleanup patterns for title matching
+_TITLE_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_FILENAME_SEPARATORS_RE = re.compile(r'[_-]')
+
 def extract_video_id_from_filename(filename):
     """Try to extract video ID from filename if it contains one."""
-    # Look for patterns like _123456789.mp4 or 123456789_ in filename
-    patterns = [
-        r'_(\d{8,})\.mp4$',  # Filename ending with _ID.mp4
-        r'_(\d{8,})_',       # ID surrounded by underscores
-        r'(\d{8,})\.mp4$',   # Filename ending with just ID.mp4
-        r'^(\d{8,})_',       # Filename starting with ID_
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, filename)
+    for pattern in _FILENAME_ID_PATTERNS:
+        match = pattern.search(filename)
         if match:
             return match.group(1)
     
@@ -46,16 +77,15 @@ def load_json_mappings(directory_path):
         if not search_path.exists():
             continue
             
-        json_files = list(search_path.glob("*.json"))
+        # Collect the JSON files in one directory scan, leaving out the scraper's own metadata file
+        with os.scandir(search_path) as entries:
+            json_files = [Path(entry.path) for entry in entries
+                          if entry.name.endswith(".json") and entry.name != "query_metadata.json"]
         
         for json_file in json_files:
-            if json_file.name == "query_metadata.json":
-                continue
-                
             try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
+                data = _json_loads(json_file.read_bytes())
+                
                 # Handle the structure: {"label": {"query": [{"id": "...", "caption": "..."}]}}
                 for label_data in data.values():
                     if isinstance(label_data, dict):
@@ -79,30 +109,43 @@ def find_matching_videos(video_files, json_mappings):
     """Try to match video files with JSON data based on titles."""
     matches = {}
     
+    # Clean each title once up front instead of once per video file
+    title_word_sets = [
+        (video_id, set(_TITLE_PUNCTUATION_RE.sub('', mapping['title']).lower().split()))
+        for video_id, mapping in json_mappings.items()
+    ]
+    
+    # Index titles by word so each file is only scored against titles it shares a word with
+    titles_by_word = {}
+    for title_index, (_, title_words) in enumerate(title_word_sets):
+        for word in title_words:
+            titles_by_word.setdefault(word, []).append(title_index)
+    
     for video_file in video_files:
         filename_no_ext = video_file.stem
         
         # Clean filename for comparison (remove underscores, make lowercase)
-        clean_filename = re.sub(r'[_-]', ' ', filename_no_ext).lower()
+        clean_filename = _FILENAME_SEPARATORS_RE.sub(' ', filename_no_ext).lower()
+        filename_words = set(clean_filename.split())
         
         best_match = None
         best_score = 0
         
-        for video_id, mapping in json_mappings.items():
-            title = mapping['title']
-            clean_title = re.sub(r'[^\w\s]', '', title).lower()
-            
+        # Titles sharing no word with the filename score 0, so only the indexed candidates are checked
+        candidate_indices = set()
+        for word in filename_words:
+            candidate_indices.update(titles_by_word.get(word, ()))
+        
+        # Visit candidates in mapping order so ties resolve as before
+        for title_index in sorted(candidate_indices):
+            video_id, title_words = title_word_sets[title_index]
             # Simple similarity check - count matching words
-            filename_words = set(clean_filename.split())
-            title_words = set(clean_title.split())
+            common_words = filename_words.intersection(title_words)
+            score = len(common_words) / len(title_words)
             
-            if len(title_words) > 0:
-                common_words = filename_words.intersection(title_words)
-                score = len(common_words) / len(title_words)
-                
-                if score > best_score and score > 0.3:  # At least 30% word match
-                    best_match = video_id
-                    best_score = score
+            if score > best_score and score > 0.3:  # At least 30% word match
+                best_match = video_id
+                best_score = score
         
         if best_match:
             matches[video_file.name] = {
@@ -128,8 +171,7 @@ def update_metadata_mappings(directory_path, new_mappings):
         }
     else:
         try:
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
+            metadata = _json_loads(metadata_file.read_bytes())
         except Exception as e:
             print(f"Error reading metadata file: {e}")
             return False
@@ -148,10 +190,9 @@ def update_metadata_mappings(directory_path, new_mappings):
             'mapping_source': mapping_data.get('source', 'manual')
         }
     
-    # Save updated metadata
+    # Save updated metadata (written atomically so a crash can't leave half-written JSON)
     try:
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        _write_text_atomic(metadata_file, _json_dumps(metadata))
         print(f"✅ Updated metadata file with {len(new_mappings)} new mappings")
         return True
     except Exception as e:
@@ -172,11 +213,10 @@ def main():
     
     print(f"🔍 Analyzing directory: {directory_path}")
     
-    # Find video files
-    video_extensions = ['.mp4', '.mov', '.webm', '.avi', '.mkv']
-    video_files = []
-    for ext in video_extensions:
-        video_files.extend(directory_path.glob(f"*{ext}"))
+    # Find video files in a single directory scan
+    video_extensions = ('.mp4', '.mov', '.webm', '.avi', '.mkv')
+    with os.scandir(directory_path) as entries:
+        video_files = [Path(entry.path) for entry in entries if entry.name.endswith(video_extensions)]
     
     if not video_files:
         print("No video files found in directory.")
@@ -189,9 +229,8 @@ def main():
     existing_mappings = {}
     if metadata_file.exists():
         try:
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-                existing_mappings = metadata.get("video_file_mappings", {})
+            metadata = _json_loads(metadata_file.read_bytes())
+            existing_mappings = metadata.get("video_file_mappings", {})
         except Exception as e:
             print(f"Warning: Could not read existing metadata: {e}")
     
@@ -219,6 +258,7 @@ def main():
     
     # Load JSON mappings
     json_mappings = load_json_mappings(directory_path)
+    matches = {}
     if json_mappings:
         print(f"📄 Found {len(json_mappings)} video entries in JSON files")
         
@@ -244,13 +284,12 @@ def main():
         }
     
     # Add JSON-based matches (these override filename-based ones)
-    if 'matches' in locals():
-        for filename, match_data in matches.items():
-            new_mappings[filename] = {
-                'video_id': match_data['video_id'],
-                'title': match_data['title'],
-                'source': f"json_match_{match_data['source']}"
-            }
+    for filename, match_data in matches.items():
+        new_mappings[filename] = {
+            'video_id': match_data['video_id'],
+            'title': match_data['title'],
+            'source': f"json_match_{match_data['source']}"
+        }
     
     if new_mappings:
         print(f"\n📋 Summary: Will create {len(new_mappings)} new mappings")